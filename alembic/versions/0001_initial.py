@@ -4,7 +4,8 @@ Revision ID: 0001_initial
 Revises:
 Create Date: 2026-01-20 00:00:00
 """
-from alembic import op
+import sqlalchemy as sa
+from alembic import context, op
 
 # revision identifiers, used by Alembic.
 revision = "0001_initial"
@@ -13,146 +14,172 @@ branch_labels = None
 depends_on = None
 
 
+# Table/function/trigger DDL is sent as a single multi-statement script so the
+# server parses and runs it in one round-trip instead of one per statement.
+# Indexes are built separately (see upgrade()).
+DDL_SCRIPT = """
+CREATE TABLE IF NOT EXISTS contracts (
+    id SERIAL PRIMARY KEY,
+    contract_number VARCHAR(50) UNIQUE NOT NULL,
+    wbs_element VARCHAR(100),
+    tip_number VARCHAR(50),
+    federal_aid_number VARCHAR(50),
+    counties TEXT,
+    description TEXT,
+    date_available DATE,
+    completion_date DATE,
+    mbe_goal DECIMAL(5,2),
+    wbe_goal DECIMAL(5,2),
+    combined_goal DECIMAL(5,2),
+    bid_opening_date TIMESTAMP,
+    proposal_length DECIMAL(10,3),
+    type_of_work VARCHAR(255),
+    location TEXT,
+    estimated_cost DECIMAL(15,2),
+    awarded_amount DECIMAL(15,2),
+    awarded_to VARCHAR(255),
+    award_date DATE,
+    source_file_path TEXT,
+    source_file_hash VARCHAR(64),
+    source_file_mtime TIMESTAMP,
+    extraction_run_id VARCHAR(64),
+    extraction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bidders (
+    id SERIAL PRIMARY KEY,
+    contract_id INTEGER REFERENCES contracts(id) ON DELETE CASCADE,
+    bidder_name VARCHAR(255) NOT NULL,
+    bidder_location VARCHAR(255),
+    total_bid_amount DECIMAL(15,2),
+    bid_rank INTEGER,
+    percentage_diff DECIMAL(6,2),
+    is_winner BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS bid_items (
+    id SERIAL PRIMARY KEY,
+    contract_id INTEGER REFERENCES contracts(id) ON DELETE CASCADE,
+    item_number VARCHAR(50),
+    item_code VARCHAR(50),
+    description TEXT,
+    quantity DECIMAL(15,3),
+    unit VARCHAR(50),
+    unit_price DECIMAL(12,2),
+    total_price DECIMAL(15,2),
+    bidder_name VARCHAR(255),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS extraction_logs (
+    id SERIAL PRIMARY KEY,
+    file_path TEXT NOT NULL,
+    document_type VARCHAR(50),
+    extraction_method VARCHAR(50),
+    status VARCHAR(20) CHECK (status IN ('success', 'partial', 'failed')),
+    error_message TEXT,
+    confidence_score DECIMAL(4,3),
+    processing_time_seconds DECIMAL(8,3),
+    records_extracted INTEGER,
+    needs_ocr BOOLEAN DEFAULT FALSE,
+    needs_ocr_reasons TEXT,
+    ocr_applied BOOLEAN DEFAULT FALSE,
+    ocr_method VARCHAR(50),
+    ocr_duration_seconds DECIMAL(8,3),
+    file_hash VARCHAR(64),
+    file_size_bytes INTEGER,
+    file_mtime TIMESTAMP,
+    run_id VARCHAR(64),
+    extraction_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Mutates NEW in a BEFORE trigger (no second UPDATE) and skips no-op updates.
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW IS DISTINCT FROM OLD THEN
+        NEW.updated_at := CURRENT_TIMESTAMP;
+    END IF;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS update_contracts_updated_at ON contracts;
+CREATE TRIGGER update_contracts_updated_at
+BEFORE UPDATE ON contracts
+FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+"""
+
+DOWNGRADE_SCRIPT = """
+DROP TRIGGER IF EXISTS update_contracts_updated_at ON contracts;
+DROP FUNCTION IF EXISTS update_updated_at_column();
+DROP TABLE IF EXISTS extraction_logs CASCADE;
+DROP TABLE IF EXISTS bid_items CASCADE;
+DROP TABLE IF EXISTS bidders CASCADE;
+DROP TABLE IF EXISTS contracts CASCADE;
+"""
+
+
+HAS_ROWS_SQL = """
+SELECT EXISTS (SELECT 1 FROM contracts)
+    OR EXISTS (SELECT 1 FROM bidders)
+    OR EXISTS (SELECT 1 FROM bid_items)
+    OR EXISTS (SELECT 1 FROM extraction_logs)
+"""
+
+
+def _index_definitions(hash_supported: bool) -> list[str]:
+    """Return index definitions (everything after CREATE INDEX ... IF NOT EXISTS)."""
+    # Equality-only lookups (contract number, file path, file hash) use HASH
+    # indexes, which are WAL-logged and crash-safe from PostgreSQL 10 onwards.
+    using_hash = "USING HASH " if hash_supported else ""
+    return [
+        f"idx_contracts_number ON contracts {using_hash}(contract_number)",
+        f"idx_extraction_logs_file ON extraction_logs {using_hash}(file_path)",
+        f"idx_extraction_logs_hash ON extraction_logs {using_hash}(file_hash)",
+        "idx_contracts_date ON contracts(bid_opening_date)",
+        "idx_bidders_contract ON bidders(contract_id)",
+        "idx_bid_items_contract ON bid_items(contract_id)",
+        "idx_extraction_logs_run ON extraction_logs(run_id)",
+        # Composite/partial indexes for the lineage and dedup queries: latest
+        # extraction per file hash, per-run status breakdowns, non-success rows
+        # only (success dominates, so it is left out) and winner lookups.
+        "idx_extraction_logs_hash_ts ON extraction_logs(file_hash, extraction_timestamp DESC)",
+        "idx_extraction_logs_run_status ON extraction_logs(run_id, status)",
+        "idx_extraction_logs_failed ON extraction_logs(extraction_timestamp) WHERE status <> 'success'",
+        "idx_bidders_contract_rank ON bidders(contract_id, bid_rank)",
+    ]
+
+
 def upgrade() -> None:
-    op.execute(
-        """
-        CREATE TABLE IF NOT EXISTS contracts (
-            id SERIAL PRIMARY KEY,
-            contract_number VARCHAR(50) UNIQUE NOT NULL,
-            wbs_element VARCHAR(100),
-            tip_number VARCHAR(50),
-            federal_aid_number VARCHAR(50),
-            counties TEXT,
-            description TEXT,
-            date_available DATE,
-            completion_date DATE,
-            mbe_goal DECIMAL(5,2),
-            wbe_goal DECIMAL(5,2),
-            combined_goal DECIMAL(5,2),
-            bid_opening_date TIMESTAMP,
-            proposal_length DECIMAL(10,3),
-            type_of_work VARCHAR(255),
-            location TEXT,
-            estimated_cost DECIMAL(15,2),
-            awarded_amount DECIMAL(15,2),
-            awarded_to VARCHAR(255),
-            award_date DATE,
-            source_file_path TEXT,
-            source_file_hash VARCHAR(64),
-            source_file_mtime TIMESTAMP,
-            extraction_run_id VARCHAR(64),
-            extraction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-    )
-
-    op.execute(
-        """
-        CREATE TABLE IF NOT EXISTS bidders (
-            id SERIAL PRIMARY KEY,
-            contract_id INTEGER REFERENCES contracts(id) ON DELETE CASCADE,
-            bidder_name VARCHAR(255) NOT NULL,
-            bidder_location VARCHAR(255),
-            total_bid_amount DECIMAL(15,2),
-            bid_rank INTEGER,
-            percentage_diff DECIMAL(6,2),
-            is_winner BOOLEAN DEFAULT FALSE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-    )
-
-    op.execute(
-        """
-        CREATE TABLE IF NOT EXISTS bid_items (
-            id SERIAL PRIMARY KEY,
-            contract_id INTEGER REFERENCES contracts(id) ON DELETE CASCADE,
-            item_number VARCHAR(50),
-            item_code VARCHAR(50),
-            description TEXT,
-            quantity DECIMAL(15,3),
-            unit VARCHAR(50),
-            unit_price DECIMAL(12,2),
-            total_price DECIMAL(15,2),
-            bidder_name VARCHAR(255),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-    )
-
-    op.execute(
-        """
-        CREATE TABLE IF NOT EXISTS extraction_logs (
-            id SERIAL PRIMARY KEY,
-            file_path TEXT NOT NULL,
-            document_type VARCHAR(50),
-            extraction_method VARCHAR(50),
-            status VARCHAR(20) CHECK (status IN ('success', 'partial', 'failed')),
-            error_message TEXT,
-            confidence_score DECIMAL(4,3),
-            processing_time_seconds DECIMAL(8,3),
-            records_extracted INTEGER,
-            needs_ocr BOOLEAN DEFAULT FALSE,
-            needs_ocr_reasons TEXT,
-            ocr_applied BOOLEAN DEFAULT FALSE,
-            ocr_method VARCHAR(50),
-            ocr_duration_seconds DECIMAL(8,3),
-            file_hash VARCHAR(64),
-            file_size_bytes INTEGER,
-            file_mtime TIMESTAMP,
-            run_id VARCHAR(64),
-            extraction_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-    )
-
-    op.execute("CREATE INDEX IF NOT EXISTS idx_contracts_number ON contracts(contract_number);")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_contracts_date ON contracts(bid_opening_date);")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_bidders_contract ON bidders(contract_id);")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_bid_items_contract ON bid_items(contract_id);")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_extraction_logs_file ON extraction_logs(file_path);")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_extraction_logs_hash ON extraction_logs(file_hash);")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_extraction_logs_status ON extraction_logs(status);")
-    op.execute("CREATE INDEX IF NOT EXISTS idx_extraction_logs_run ON extraction_logs(run_id);")
-
-    op.execute(
-        """
-        CREATE OR REPLACE FUNCTION update_updated_at_column()
-        RETURNS TRIGGER AS $$
-        BEGIN
-            NEW.updated_at = CURRENT_TIMESTAMP;
-            RETURN NEW;
-        END;
-        $$ language 'plpgsql';
-        """
-    )
-
-    op.execute("DROP TRIGGER IF EXISTS update_contracts_updated_at ON contracts;")
-    op.execute(
-        """
-        CREATE TRIGGER update_contracts_updated_at
-        BEFORE UPDATE ON contracts
-        FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
-        """
-    )
-
-    op.execute("ALTER TABLE contracts ADD COLUMN IF NOT EXISTS source_file_hash VARCHAR(64);")
-    op.execute("ALTER TABLE contracts ADD COLUMN IF NOT EXISTS source_file_mtime TIMESTAMP;")
-    op.execute("ALTER TABLE contracts ADD COLUMN IF NOT EXISTS extraction_run_id VARCHAR(64);")
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS needs_ocr BOOLEAN DEFAULT FALSE;")
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS needs_ocr_reasons TEXT;")
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS ocr_applied BOOLEAN DEFAULT FALSE;")
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS ocr_method VARCHAR(50);")
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS ocr_duration_seconds DECIMAL(8,3);")
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS run_id VARCHAR(64);")
+    op.execute(DDL_SCRIPT)
+
+    if context.is_offline_mode():
+        hash_supported, has_rows = True, False
+    else:
+        bind = op.get_bind()
+        hash_supported = bind.dialect.server_version_info >= (10,)
+        has_rows = bool(bind.execute(sa.text(HAS_ROWS_SQL)).scalar())
+
+    indexes = _index_definitions(hash_supported)
+
+    if not has_rows:
+        # Fresh tables: index builds are instant, keep them in the same
+        # transaction and send them in one round-trip.
+        op.execute("\n".join(f"CREATE INDEX IF NOT EXISTS {index};" for index in indexes))
+        return
+
+    # Re-applying over existing data (e.g. after a restore): build concurrently
+    # so writers are not blocked. CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute("SET maintenance_work_mem = '1GB'")
+        for index in indexes:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index}")
+        op.execute("RESET maintenance_work_mem")
 
 
 def downgrade() -> None:
-    op.execute("DROP TRIGGER IF EXISTS update_contracts_updated_at ON contracts;")
-    op.execute("DROP FUNCTION IF EXISTS update_updated_at_column();")
-    op.execute("DROP TABLE IF EXISTS extraction_logs CASCADE;")
-    op.execute("DROP TABLE IF EXISTS bid_items CASCADE;")
-    op.execute("DROP TABLE IF EXISTS bidders CASCADE;")
-    op.execute("DROP TABLE IF EXISTS contracts CASCADE;")
+    op.execute(DOWNGRADE_SCRIPT)
@@ -14,16 +14,25 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.execute("ALTER TABLE contracts ADD COLUMN IF NOT EXISTS source_file_hash VARCHAR(64);")
-    op.execute("ALTER TABLE contracts ADD COLUMN IF NOT EXISTS source_file_mtime TIMESTAMP;")
-    op.execute("ALTER TABLE contracts ADD COLUMN IF NOT EXISTS extraction_run_id VARCHAR(64);")
-
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS ocr_applied BOOLEAN DEFAULT FALSE;")
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS ocr_method VARCHAR(50);")
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS ocr_duration_seconds DECIMAL(8,3);")
-    op.execute("ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS run_id VARCHAR(64);")
-
-    op.execute("CREATE INDEX IF NOT EXISTS idx_extraction_logs_run ON extraction_logs(run_id);")
+    # A single DO block applies every column add in one server round-trip.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            ALTER TABLE contracts ADD COLUMN IF NOT EXISTS source_file_hash VARCHAR(64);
+            ALTER TABLE contracts ADD COLUMN IF NOT EXISTS source_file_mtime TIMESTAMP;
+            ALTER TABLE contracts ADD COLUMN IF NOT EXISTS extraction_run_id VARCHAR(64);
+
+            ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS ocr_applied BOOLEAN DEFAULT FALSE;
+            ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS ocr_method VARCHAR(50);
+            ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS ocr_duration_seconds DECIMAL(8,3);
+            ALTER TABLE extraction_logs ADD COLUMN IF NOT EXISTS run_id VARCHAR(64);
+
+            CREATE INDEX IF NOT EXISTS idx_extraction_logs_run ON extraction_logs(run_id);
+        END
+        $$;
+        """
+    )
 
 
 def downgrade() -> None:
@@ -0,0 +1,28 @@
+"""Index extraction logs by file and timestamp.
+
+Revision ID: 0003_add_file_timestamp_index
+Revises: 0002_add_ocr_lineage
+Create Date: 2026-01-20 00:00:02
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_add_file_timestamp_index"
+down_revision = "0002_add_ocr_lineage"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Latest extraction per file; built concurrently so log writers are not
+    # blocked on an existing table. CONCURRENTLY cannot run in a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_extraction_logs_file_ts "
+            "ON extraction_logs(file_path, extraction_timestamp DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_extraction_logs_file_ts")
@@ -0,0 +1,35 @@
+"""Allow the skipped status in extraction logs.
+
+Revision ID: 0004_allow_skipped_status
+Revises: 0003_add_file_timestamp_index
+Create Date: 2026-01-20 00:00:03
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_allow_skipped_status"
+down_revision = "0003_add_file_timestamp_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Incremental runs log unchanged files as "skipped".
+    op.execute(
+        """
+        ALTER TABLE extraction_logs DROP CONSTRAINT IF EXISTS extraction_logs_status_check;
+        ALTER TABLE extraction_logs ADD CONSTRAINT extraction_logs_status_check
+            CHECK (status IN ('success', 'partial', 'failed', 'skipped'));
+        """
+    )
+
+
+def downgrade() -> None:
+    # NOT VALID: existing skipped rows are kept, only new rows are checked.
+    op.execute(
+        """
+        ALTER TABLE extraction_logs DROP CONSTRAINT IF EXISTS extraction_logs_status_check;
+        ALTER TABLE extraction_logs ADD CONSTRAINT extraction_logs_status_check
+            CHECK (status IN ('success', 'partial', 'failed')) NOT VALID;
+        """
+    )
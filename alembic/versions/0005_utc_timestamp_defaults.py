@@ -0,0 +1,52 @@
+"""Default row timestamps to UTC.
+
+Revision ID: 0005_utc_timestamp_defaults
+Revises: 0004_allow_skipped_status
+Create Date: 2026-01-20 00:00:04
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005_utc_timestamp_defaults"
+down_revision = "0004_allow_skipped_status"
+branch_labels = None
+depends_on = None
+
+# The loader leaves these to the server; they were always written as naive
+# UTC, so the defaults and the updated_at trigger use the same clock.
+TIMESTAMP_COLUMNS = (
+    ("contracts", "extraction_date"),
+    ("contracts", "created_at"),
+    ("contracts", "updated_at"),
+    ("bidders", "created_at"),
+    ("bid_items", "created_at"),
+    ("extraction_logs", "extraction_timestamp"),
+)
+
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW IS DISTINCT FROM OLD THEN
+        NEW.updated_at := {now};
+    END IF;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+"""
+
+
+def _script(default: str) -> str:
+    statements = [
+        f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {default};"
+        for table, column in TIMESTAMP_COLUMNS
+    ]
+    return "\n".join(statements) + TRIGGER_FUNCTION.format(now=default)
+
+
+def upgrade() -> None:
+    op.execute(_script("timezone('utc', CURRENT_TIMESTAMP)"))
+
+
+def downgrade() -> None:
+    op.execute(_script("CURRENT_TIMESTAMP"))
@@ -20,6 +20,9 @@ def main() -> None:
     error_prefix = os.getenv("S3_ERROR_PREFIX", "error/")
     output_format = os.getenv("OUTPUT_FORMAT", "parquet")
     batch_size = os.getenv("BATCH_SIZE")
+    max_workers = os.getenv("MAX_WORKERS")
+    download_workers = int(os.getenv("S3_DOWNLOAD_WORKERS", "32"))
+    move_workers = int(os.getenv("S3_MOVE_WORKERS", "32"))
 
     if not bucket:
         raise ValueError("S3_BUCKET is required")
@@ -32,6 +35,7 @@ def main() -> None:
         raw_prefix=raw_prefix,
         local_dir=local_dir,
         max_items=max_items,
+        max_workers=download_workers,
     )
     ingested = ingestor.download_all()
     if not ingested:
@@ -40,7 +44,7 @@ def main() -> None:
 
     key_map = ingestor.build_key_map(ingested)
 
-    pipeline = Pipeline(local_dir)
+    pipeline = Pipeline(local_dir, max_workers=int(max_workers) if max_workers else None)
     results = pipeline.process_directory("**/*.pdf")
 
     loader = S3Loader(
@@ -50,14 +54,16 @@ def main() -> None:
     )
     loader.upload_results(results, output_format)
 
+    moves = []
     for result in results:
-        file_path = result.get("file_path")
-        s3_key = key_map.get(file_path)
+        s3_key = key_map.get(result.get("file_path"))
         if not s3_key:
             continue
-        status = result.get("status")
-        success = status in ("success", "partial")
-        loader.move_source(s3_key, success=success)
+        success = result.get("status") in ("success", "partial")
+        moves.append((s3_key, success))
+
+    # Copies run concurrently; sources are deleted in batches.
+    loader.move_sources(moves, max_workers=move_workers)
 
 
 if __name__ == "__main__":
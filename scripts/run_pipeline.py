@@ -22,6 +22,22 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.pipeline.orchestrator import Pipeline
 from src.loaders.postgres_loader import PostgresLoader
+from src.utils.json_output import write_json
+
+
+def serve(pipeline: Pipeline, loader: PostgresLoader | None = None) -> None:
+    """Resident worker mode: read PDF paths from stdin, write one JSON result per line."""
+    # Keep stdout for results; logs go to stderr
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(sys.stderr))
+
+    def emit(result: dict) -> None:
+        if loader is not None:
+            result["loaded"] = loader.load_extraction_result(result)
+        sys.stdout.write(json.dumps(result, default=str) + "\n")
+        sys.stdout.flush()
+
+    paths = (line.strip() for line in sys.stdin)
+    pipeline.serve((path for path in paths if path), emit)
 
 
 def run_migrations(database_url: str | None) -> None:
@@ -63,11 +79,27 @@ def main():
         "--state-file",
         help="Optional path for incremental state cache"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for extraction (default: CPU count)"
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep workers resident and process PDF paths read from stdin, one JSON result per line"
+    )
     parser.add_argument(
         "--load-postgres",
         action="store_true",
         help="Load extraction results into PostgreSQL"
     )
+    parser.add_argument(
+        "--load-workers",
+        type=int,
+        default=1,
+        help="Worker processes for --load-postgres, one contract per worker at a time (default: 1)"
+    )
     parser.add_argument(
         "--database-url",
         help="PostgreSQL connection string (overrides DATABASE_URL env var)"
@@ -79,8 +111,23 @@ def main():
     pipeline = Pipeline(
         args.source_dir,
         incremental=args.incremental,
-        state_file=args.state_file
+        state_file=args.state_file,
+        max_workers=args.workers,
     )
+
+    if args.serve:
+        loader = None
+        if args.load_postgres:
+            run_migrations(args.database_url)
+            loader = PostgresLoader(database_url=args.database_url)
+            loader.create_tables()
+        try:
+            serve(pipeline, loader)
+        finally:
+            if loader is not None:
+                loader.close()
+        return
+
     results = pipeline.process_directory(args.pattern)
     
     # Get summary
@@ -105,11 +152,10 @@ def main():
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump({
-                "summary": summary,
-                "results": results if not args.summary_only else []
-            }, f, indent=2, default=str)
+        write_json(output_path, {
+            "summary": summary,
+            "results": results if not args.summary_only else []
+        })
         
         print(f"Results saved to: {output_path}")
 
@@ -120,7 +166,7 @@ def main():
             run_migrations(args.database_url)
             loader = PostgresLoader(database_url=args.database_url)
             loader.create_tables()
-            load_summary = loader.load_batch(results)
+            load_summary = loader.load_batch(results, max_workers=args.load_workers)
             loader.close()
             print(
                 f"PostgreSQL load completed: {load_summary['successful']}/"
@@ -31,9 +31,9 @@ CREATE TABLE contracts (
     source_file_hash VARCHAR(64),
     source_file_mtime TIMESTAMP,
     extraction_run_id VARCHAR(64),
-    extraction_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    extraction_date TIMESTAMP DEFAULT timezone('utc', CURRENT_TIMESTAMP),
+    created_at TIMESTAMP DEFAULT timezone('utc', CURRENT_TIMESTAMP),
+    updated_at TIMESTAMP DEFAULT timezone('utc', CURRENT_TIMESTAMP)
 );
 
 -- Bidders table (companies that submitted bids)
@@ -46,7 +46,7 @@ CREATE TABLE bidders (
     bid_rank INTEGER,
     percentage_diff DECIMAL(6,2),
     is_winner BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT timezone('utc', CURRENT_TIMESTAMP)
 );
 
 -- Bid Items table (line items in bid tabs)
@@ -61,7 +61,7 @@ CREATE TABLE bid_items (
     unit_price DECIMAL(12,2),
     total_price DECIMAL(15,2),
     bidder_name VARCHAR(255),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT timezone('utc', CURRENT_TIMESTAMP)
 );
 
 -- Extraction logs (track pipeline execution)
@@ -70,7 +70,7 @@ CREATE TABLE extraction_logs (
     file_path TEXT NOT NULL,
     document_type VARCHAR(50),
     extraction_method VARCHAR(50),
-    status VARCHAR(20) CHECK (status IN ('success', 'partial', 'failed')),
+    status VARCHAR(20) CHECK (status IN ('success', 'partial', 'failed', 'skipped')),
     error_message TEXT,
     confidence_score DECIMAL(4,3),
     processing_time_seconds DECIMAL(8,3),
@@ -84,24 +84,30 @@ CREATE TABLE extraction_logs (
     file_size_bytes INTEGER,
     file_mtime TIMESTAMP,
     run_id VARCHAR(64),
-    extraction_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    extraction_timestamp TIMESTAMP DEFAULT timezone('utc', CURRENT_TIMESTAMP)
 );
 
 -- Indexes for performance
-CREATE INDEX idx_contracts_number ON contracts(contract_number);
+CREATE INDEX idx_contracts_number ON contracts USING HASH (contract_number);
 CREATE INDEX idx_contracts_date ON contracts(bid_opening_date);
 CREATE INDEX idx_bidders_contract ON bidders(contract_id);
 CREATE INDEX idx_bid_items_contract ON bid_items(contract_id);
-CREATE INDEX idx_extraction_logs_file ON extraction_logs(file_path);
-CREATE INDEX idx_extraction_logs_hash ON extraction_logs(file_hash);
-CREATE INDEX idx_extraction_logs_status ON extraction_logs(status);
+CREATE INDEX idx_extraction_logs_file ON extraction_logs USING HASH (file_path);
+CREATE INDEX idx_extraction_logs_hash ON extraction_logs USING HASH (file_hash);
 CREATE INDEX idx_extraction_logs_run ON extraction_logs(run_id);
+CREATE INDEX idx_extraction_logs_hash_ts ON extraction_logs(file_hash, extraction_timestamp DESC);
+CREATE INDEX idx_extraction_logs_file_ts ON extraction_logs(file_path, extraction_timestamp DESC);
+CREATE INDEX idx_extraction_logs_run_status ON extraction_logs(run_id, status);
+CREATE INDEX idx_extraction_logs_failed ON extraction_logs(extraction_timestamp) WHERE status <> 'success';
+CREATE INDEX idx_bidders_contract_rank ON bidders(contract_id, bid_rank);
 
 -- Updated_at trigger
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
 BEGIN
-    NEW.updated_at = CURRENT_TIMESTAMP;
+    IF TG_OP = 'UPDATE' AND NEW IS DISTINCT FROM OLD THEN
+        NEW.updated_at := timezone('utc', CURRENT_TIMESTAMP);
+    END IF;
     RETURN NEW;
 END;
 $$ language 'plpgsql';
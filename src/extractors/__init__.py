@@ -7,7 +7,18 @@ from .bids_as_read_extractor import BidsAsReadExtractor
 from .invitation_extractor import InvitationToBidExtractor
 from .item_c_extractor import ItemCExtractor
 
+# Document type value (see pipeline.classifier.DocumentType) -> extractor class
+EXTRACTORS: dict[str, type[BaseExtractor]] = {
+    "invitation_to_bid": InvitationToBidExtractor,
+    "bid_tabs": BidTabsExtractor,
+    "award_letter": AwardLetterExtractor,
+    "item_c_report": ItemCExtractor,
+    "bid_summary": BidSummaryExtractor,
+    "bids_as_read": BidsAsReadExtractor,
+}
+
 __all__ = [
+    "EXTRACTORS",
     "BaseExtractor",
     "InvitationToBidExtractor",
     "BidTabsExtractor",
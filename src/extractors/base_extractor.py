@@ -1,25 +1,201 @@
 """Base extractor interface."""
+import calendar
+import hashlib
+import json
+import os
+import re
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 
-import pypdf
+import fitz
+import pdfplumber
 import structlog
 
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional accelerator
+    re2 = None
+
 logger = structlog.get_logger()
 
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+# Documents with at least this many pages may be split across page workers.
+PARALLEL_PAGE_THRESHOLD = 32
+
+
+def _extract_pages_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract text for pages [start, stop) in a worker process."""
+    with fitz.open(pdf_path) as doc:
+        return [doc.load_page(page_num).get_text() or "" for page_num in range(start, stop)]
+
+
+def _extract_plumber_pages_range(pdf_path: str, start: int, stop: Optional[int]) -> List[str]:
+    """Extract text for pages [start, stop) with pdfplumber (stop=None: to the end)."""
+    texts = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            texts.append(page.extract_text() or "")
+            page.close()
+    return texts
+
+
+# Full and abbreviated month names, as accepted by strptime's %B / %b
+_MONTHS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names)
+    if name
+}
+_DATE_RE = re.compile(
+    r'([A-Za-z]+)\s+(\d{1,2})\s+(\d{4})|(\d{1,2})/(\d{1,2})/(\d{4})|(\d{4})-(\d{1,2})-(\d{1,2})'
+)
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s+([AP]M)', re.IGNORECASE)
+
+
+def parse_date(date_str: str) -> Optional[date]:
+    """Parse "March 3, 2021", "Mar 3 2021", "03/03/2021" or "2021-03-03".
+
+    One regex match plus range checks instead of trying strptime formats
+    (each miss raises and catches a ValueError).
+
+    Args:
+        date_str: Date text (commas and surrounding whitespace are ignored)
+
+    Returns:
+        Parsed date, or None if the text is not a valid date
+    """
+    match = _DATE_RE.fullmatch(date_str.replace(',', '').strip())
+    if not match:
+        return None
+
+    month_name, day, year, month_num, day_num, year_num, iso_year, iso_month, iso_day = match.groups()
+    try:
+        if month_name is not None:
+            month = _MONTHS.get(month_name.lower())
+            if month is None:
+                return None
+            return date(int(year), month, int(day))
+        if month_num is not None:
+            return date(int(year_num), int(month_num), int(day_num))
+        return date(int(iso_year), int(iso_month), int(iso_day))
+    except ValueError:
+        return None
+
+
+def parse_datetime(date_str: str, time_str: str) -> Optional[datetime]:
+    """Parse a date (see parse_date) and a 12-hour "2:00 PM" time.
+
+    Args:
+        date_str: Date text
+        time_str: Time text with AM/PM
+
+    Returns:
+        Parsed datetime, or None if either part is invalid
+    """
+    parsed_date = parse_date(date_str)
+    match = _TIME_RE.fullmatch(time_str.strip())
+    if parsed_date is None or not match:
+        return None
+
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if not 1 <= hour <= 12 or minute > 59:
+        return None
+    hour = hour % 12 + (12 if match.group(3).upper() == "PM" else 0)
+    return datetime(parsed_date.year, parsed_date.month, parsed_date.day, hour, minute)
+
+
+# Numeric helpers. These run for every bid row and table cell, so they are
+# plain module functions rather than methods (no per-call method binding).
+def parse_number(value: Any) -> Optional[float]:
+    """Parse a number such as "1,250.00"; None, blank or invalid values give None."""
+    if value is None:
+        return None
+    try:
+        return float(str(value).replace(",", ""))
+    except ValueError:
+        return None
+
+
+def parse_int(value: Optional[str]) -> Optional[int]:
+    """Parse an integer; None, blank or invalid values give None."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=128)
+def _read_cache_entry(cache_path: str, mtime_ns: int) -> str:
+    """Read a result cache entry (keyed on mtime so rewritten entries are re-read)."""
+    return Path(cache_path).read_text(encoding="utf-8")
+
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """Compile an extraction regex, using RE2 when it is installed.
+
+    RE2 matches in linear time (no backtracking on ``.*?``/DOTALL scans) and
+    exposes the same ``search``/``group`` API. Flags are passed inline since
+    RE2 does not accept ``re`` flags; patterns RE2 cannot handle fall back
+    to ``re``.
+
+    Args:
+        pattern: Regular expression
+        flags: ``re`` flags (IGNORECASE, MULTILINE, DOTALL)
+
+    Returns:
+        Compiled pattern object
+    """
+    if re2 is not None:
+        inline = "".join(char for flag, char in _INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
 
 class BaseExtractor(ABC):
     """Base class for all PDF extractors."""
+
+    # Field name -> patterns compiled once per class (see compile_pattern),
+    # tried in order by match_field.
+    FIELD_PATTERNS: ClassVar[Dict[str, Tuple[Any, ...]]] = {}
+    # Optional lowercase literals per field: if none occur in the text, the
+    # field's patterns are not run at all.
+    FIELD_LITERALS: ClassVar[Dict[str, Tuple[str, ...]]] = {}
     
-    def __init__(self, pdf_path: str | Path):
+    def __init__(
+        self,
+        pdf_path: str | Path,
+        page_workers: Optional[int] = None,
+        cache_dir: Optional[str | Path] = None,
+    ):
         """Initialize extractor with PDF path.
         
         Args:
             pdf_path: Path to the PDF file
+            page_workers: Worker processes for extracting large PDFs page-parallel
+                (default: PDF_PAGE_WORKERS env var, 0 disables)
+            cache_dir: Directory for cached extraction results keyed by file hash
+                (default: EXTRACTION_CACHE_DIR env var, unset disables)
         """
+        env_page_workers = os.getenv("PDF_PAGE_WORKERS", "")
+        if page_workers is None:
+            page_workers = int(env_page_workers) if env_page_workers.strip().isdigit() else 0
+        if cache_dir is None:
+            cache_dir = os.getenv("EXTRACTION_CACHE_DIR") or None
+
         self.pdf_path = Path(pdf_path)
+        self.page_workers = page_workers
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
         self.pdf_name = self.pdf_path.name
         self.extraction_method = self.__class__.__name__
         self.start_time = None
@@ -27,23 +203,108 @@ class BaseExtractor(ABC):
         
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {self.pdf_path}")
+
+    @cached_property
+    def _pages_text(self) -> List[str]:
+        """Per-page text, extracted once with PyMuPDF and shared by all text helpers."""
+        with fitz.open(self.pdf_path) as doc:
+            page_count = doc.page_count
+            if not self._use_page_workers(page_count):
+                return [page.get_text() or "" for page in doc]
+        return self._extract_pages_parallel(page_count)
+
+    def _use_page_workers(self, page_count: int) -> bool:
+        """Whether a document of ``page_count`` pages is split across page workers."""
+        return self.page_workers >= 2 and page_count >= PARALLEL_PAGE_THRESHOLD
+
+    def _extract_pages_parallel(self, page_count: int, worker: Callable = _extract_pages_range) -> List:
+        """Run a per-page worker in contiguous blocks across worker processes.
+
+        Each worker opens the document once for its block and returns one
+        entry per page; blocks are joined back in page order.
+
+        Args:
+            page_count: Number of pages in the document
+            worker: Module-level ``(pdf_path, start, stop) -> list`` function
+                (default: PyMuPDF page text)
+        """
+        workers = min(self.page_workers, page_count)
+        block = -(-page_count // workers)
+        starts = list(range(0, page_count, block))
+        stops = [min(start + block, page_count) for start in starts]
+
+        logger.info("Extracting pages in parallel", file=self.pdf_name, pages=page_count, workers=len(starts))
+        with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+            blocks = executor.map(worker, [str(self.pdf_path)] * len(starts), starts, stops)
+            return [page_result for block_results in blocks for page_result in block_results]
     
     def extract_text(self) -> str:
-        """Extract raw text from PDF using pypdf.
+        """Extract raw text from PDF using PyMuPDF.
         
         Returns:
             Full text content of the PDF
         """
         try:
-            reader = pypdf.PdfReader(str(self.pdf_path))
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            return "".join(f"{page_text}\n" for page_text in self._pages_text)
         except Exception as e:
             logger.error("Failed to extract text", file=self.pdf_name, error=str(e))
             raise
     
+    def extract_text_with_pdfplumber(self) -> str:
+        """Extract raw text using pdfplumber's layout analysis.
+
+        Slower than PyMuPDF; used as a fallback when PyMuPDF finds no text.
+        Large documents are split across page workers like extract_text.
+
+        Returns:
+            Full text, pages joined by newlines
+        """
+        if self.page_workers >= 2:
+            with pdfplumber.open(self.pdf_path) as pdf:
+                page_count = len(pdf.pages)
+            if self._use_page_workers(page_count):
+                return "\n".join(self._extract_pages_parallel(page_count, _extract_plumber_pages_range))
+        return "\n".join(_extract_plumber_pages_range(str(self.pdf_path), 0, None))
+
+    def _extract_text_any(self) -> str:
+        """Extract text with the cheapest backend that finds any.
+
+        PyMuPDF (extract_text, cached) first, then pdfplumber's layout
+        analysis, then a direct PyMuPDF read if extract_text raised.
+
+        Returns:
+            Extracted text (empty if no backend found any)
+        """
+        text = ""
+        pymupdf_failed = False
+        try:
+            text = self.extract_text() or ""
+        except Exception:
+            text = ""
+            pymupdf_failed = True
+
+        if text.strip():
+            return text
+
+        try:
+            text = self.extract_text_with_pdfplumber()
+        except Exception:
+            text = ""
+
+        # A direct PyMuPDF read is only worth retrying if extract_text raised;
+        # if it ran and found no text, reading the pages again finds none either.
+        if text.strip() or not pymupdf_failed:
+            return text
+
+        try:
+            with fitz.open(self.pdf_path) as doc:
+                parts = [page.get_text() or "" for page in doc]
+            text = "\n".join(parts)
+        except Exception:
+            text = ""
+
+        return text
+
     def extract_text_from_page(self, page_num: int) -> str:
         """Extract text from a specific page.
         
@@ -54,14 +315,51 @@ class BaseExtractor(ABC):
             Text content of the specified page
         """
         try:
-            reader = pypdf.PdfReader(str(self.pdf_path))
-            if page_num >= len(reader.pages):
+            pages_text = self._pages_text
+            if page_num >= len(pages_text):
                 raise ValueError(f"Page {page_num} does not exist")
-            return reader.pages[page_num].extract_text()
+            return pages_text[page_num]
         except Exception as e:
             logger.error("Failed to extract page", page=page_num, error=str(e))
             raise
     
+    def match_field(
+        self,
+        text: str,
+        field: str,
+        convert: Optional[Callable[[str], Any]] = None,
+        lowered: Optional[str] = None,
+    ) -> Any:
+        """Return the first capture of ``field``'s patterns in ``text``.
+
+        Args:
+            text: Text to search
+            field: Key into FIELD_PATTERNS
+            convert: Optional conversion of the captured string; a ValueError
+                moves on to the next pattern
+            lowered: ``text.lower()`` if the caller already has it
+
+        Returns:
+            Captured (converted) value, or None if nothing matched
+        """
+        literals = self.FIELD_LITERALS.get(field)
+        if literals:
+            lowered = text.lower() if lowered is None else lowered
+            if not any(literal in lowered for literal in literals):
+                return None
+
+        for pattern in self.FIELD_PATTERNS[field]:
+            match = pattern.search(text)
+            if match is None:
+                continue
+            if convert is None:
+                return match.group(1)
+            try:
+                return convert(match.group(1))
+            except ValueError:
+                continue
+        return None
+
     @abstractmethod
     def extract(self) -> Dict:
         """Extract structured data from PDF.
@@ -73,15 +371,66 @@ class BaseExtractor(ABC):
         """
         pass
     
-    def run_extraction(self) -> Dict:
+    def _result_cache_path(self, file_hash: Optional[str] = None) -> Path:
+        """Cache entry path for this file and extractor class."""
+        if file_hash is None:
+            with open(self.pdf_path, "rb") as f:
+                file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+        return self.cache_dir / f"{file_hash}.{self.__class__.__name__}.json"
+
+    def _load_cached_result(self, cache_path: Path) -> Optional[Dict]:
+        """Return the cached ``data``/``text_stats`` entry, or None on a miss."""
+        try:
+            mtime_ns = cache_path.stat().st_mtime_ns
+            return json.loads(_read_cache_entry(str(cache_path), mtime_ns))
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_result(self, cache_path: Path, data: Dict, text_stats: Dict) -> None:
+        """Write a cache entry atomically; failures only cost the cache."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"data": data, "text_stats": text_stats}, default=str),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Failed to write extraction cache", file=self.pdf_name, error=str(e))
+
+    def run_extraction(self, file_hash: Optional[str] = None) -> Dict:
         """Run the extraction with timing and error handling.
         
+        Args:
+            file_hash: SHA-256 of the PDF if the caller already has it
+                (only used for the result cache)
+        
         Returns:
             Dictionary with extraction results and metadata
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         
         try:
+            cache_path = None
+            if self.cache_dir is not None:
+                cache_path = self._result_cache_path(file_hash)
+                cached = self._load_cached_result(cache_path)
+                if cached is not None:
+                    self.processing_time = (time.perf_counter_ns() - self.start_time) / 1e9
+                    logger.info("Extraction cache hit", file=self.pdf_name, method=self.extraction_method)
+                    return {
+                        "status": "success",
+                        "data": cached["data"],
+                        "metadata": {
+                            "file_path": str(self.pdf_path),
+                            "extraction_method": self.extraction_method,
+                            "processing_time": self.processing_time,
+                            "cache_hit": True,
+                            **cached["text_stats"],
+                        }
+                    }
+
             logger.info(
                 "Starting extraction",
                 file=self.pdf_name,
@@ -90,14 +439,16 @@ class BaseExtractor(ABC):
             
             data = self.extract()
             text_stats = self._extract_text_stats()
+            if cache_path is not None:
+                self._store_cached_result(cache_path, data, text_stats)
             
-            self.processing_time = time.time() - self.start_time
+            self.processing_time = (time.perf_counter_ns() - self.start_time) / 1e9
             
             logger.info(
                 "Extraction completed",
                 file=self.pdf_name,
                 method=self.extraction_method,
-                processing_time=f"{self.processing_time:.2f}s"
+                processing_time=f"{self.processing_time * 1000:.1f}ms"
             )
             
             return {
@@ -112,13 +463,13 @@ class BaseExtractor(ABC):
             }
             
         except Exception as e:
-            self.processing_time = time.time() - self.start_time
+            self.processing_time = (time.perf_counter_ns() - self.start_time) / 1e9
             logger.error(
                 "Extraction failed",
                 file=self.pdf_name,
                 method=self.extraction_method,
                 error=str(e),
-                processing_time=f"{self.processing_time:.2f}s"
+                processing_time=f"{self.processing_time * 1000:.1f}ms"
             )
             
             text_stats = self._extract_text_stats()
@@ -153,24 +504,17 @@ class BaseExtractor(ABC):
         return filled_fields / total_fields if total_fields > 0 else 0.0
 
     def _extract_text_stats(self) -> Dict:
-        """Compute simple text stats using pypdf.
+        """Compute simple text stats from the cached page text.
 
         Returns:
             Dict with text length and pages with text.
         """
         try:
-            reader = pypdf.PdfReader(str(self.pdf_path))
-            text_length = 0
-            pages_with_text = 0
-            for page in reader.pages:
-                page_text = page.extract_text() or ""
-                if page_text.strip():
-                    pages_with_text += 1
-                    text_length += len(page_text)
+            pages_text = [page_text for page_text in self._pages_text if page_text.strip()]
             return {
-                "text_length": text_length,
-                "text_pages_with_content": pages_with_text,
-                "text_page_count": len(reader.pages),
+                "text_length": sum(len(page_text) for page_text in pages_text),
+                "text_pages_with_content": len(pages_text),
+                "text_page_count": len(self._pages_text),
             }
         except Exception:
             return {
@@ -2,15 +2,56 @@
 import re
 from typing import Dict, List, Optional
 
-import fitz
-import pdfplumber
-
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, compile_pattern, parse_int, parse_number
+
+# Bidder rows, tried in order against each normalized line
+_BIDDER_LINE_PATTERNS = (
+    re.compile(
+        r"^(?P<rank>\d+)\s+"
+        r"(?P<bidder>[A-Z][A-Z0-9&.,'\- ]{3,})\s+"
+        r"(?P<location>[A-Z][A-Z .\-]+,\s*[A-Z]{2})\s+"
+        r"(?P<amount>[\d,]+\.\d{2})(?:\s+(?P<percent>[-+]?\d+(?:\.\d+)?))?%?$"
+    ),
+    re.compile(
+        r"^(?P<bidder>[A-Z][A-Z0-9&.,'\- ]{3,})\s+"
+        r"(?P<location>[A-Z][A-Z .\-]+,\s*[A-Z]{2})\s+"
+        r"(?P<amount>[\d,]+\.\d{2})\s+(?P<rank>\d+)$"
+    ),
+    re.compile(
+        r"^(?P<amount>[\d,]+\.\d{2})\s+"
+        r"(?P<bidder>[A-Z][A-Z0-9&.,'\- ]{3,})"
+        r"(?:\s+(?P<location>[A-Z][A-Z .\-]+,\s*[A-Z]{2}))?$"
+    ),
+)
+_LETTER_RE = re.compile(r"[A-Z]")
+# Header/non-data lines contain any of these ("BIDDERS" is covered by "BIDDER",
+# "BID SUMMARY" by "SUMMARY"); one alternation search instead of a substring
+# test per keyword
+_HEADER_RE = re.compile("|".join(map(re.escape, (
+    "CONTRACT", "TOTAL", "ENGINEER", "BIDDER", "SUMMARY",
+))))
+
+
+def _parse_percent(value: Optional[str]) -> Optional[float]:
+    """Parse percentage value."""
+    if not value:
+        return None
+    try:
+        return float(value.replace("%", ""))
+    except ValueError:
+        return None
 
 
 class BidSummaryExtractor(BaseExtractor):
     """Extract data from Bid Summary PDFs."""
 
+    FIELD_PATTERNS = {
+        "contract_number": (
+            compile_pattern(r"(DA\d{5})", re.IGNORECASE),
+            compile_pattern(r"\b(\d{8})\b", re.IGNORECASE),
+        ),
+    }
+
     def extract(self) -> Dict:
         """Extract structured data from Bid Summary.
 
@@ -28,54 +69,12 @@ class BidSummaryExtractor(BaseExtractor):
             "bid_items": [],
         }
 
-    def _extract_text_any(self) -> str:
-        """Try multiple text extraction strategies."""
-        text = ""
-        try:
-            text = self.extract_text() or ""
-        except Exception:
-            text = ""
-
-        if text.strip():
-            return text
-
-        try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                parts = [page.extract_text() or "" for page in pdf.pages]
-            text = "\n".join(parts)
-        except Exception:
-            text = ""
-
-        if text.strip():
-            return text
-
-        try:
-            doc = fitz.open(self.pdf_path)
-            parts = [page.get_text() or "" for page in doc]
-            text = "\n".join(parts)
-        except Exception:
-            text = ""
-
-        return text
-
     def _extract_contract_number(self, text: str) -> Optional[str]:
         """Extract contract number from text or filename."""
-        patterns = [
-            r"(DA\d{5})",
-            r"\b(\d{8})\b",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
-
-        filename = self.pdf_name.upper()
-        for pattern in patterns:
-            match = re.search(pattern, filename)
-            if match:
-                return match.group(1).upper()
-
-        return None
+        return (
+            self.match_field(text, "contract_number", str.upper)
+            or self.match_field(self.pdf_name.upper(), "contract_number", str.upper)
+        )
 
     def _extract_bidders(self, text: str) -> List[Dict]:
         """Extract bidder summary information."""
@@ -85,48 +84,29 @@ class BidSummaryExtractor(BaseExtractor):
 
         lines = [self._normalize_line(line) for line in text.splitlines()]
 
-        patterns = [
-            re.compile(
-                r"^(?P<rank>\d+)\s+"
-                r"(?P<bidder>[A-Z][A-Z0-9&.,'\- ]{3,})\s+"
-                r"(?P<location>[A-Z][A-Z .\-]+,\s*[A-Z]{2})\s+"
-                r"(?P<amount>[\d,]+\.\d{2})(?:\s+(?P<percent>[-+]?\d+(?:\.\d+)?))?%?$"
-            ),
-            re.compile(
-                r"^(?P<bidder>[A-Z][A-Z0-9&.,'\- ]{3,})\s+"
-                r"(?P<location>[A-Z][A-Z .\-]+,\s*[A-Z]{2})\s+"
-                r"(?P<amount>[\d,]+\.\d{2})\s+(?P<rank>\d+)$"
-            ),
-            re.compile(
-                r"^(?P<amount>[\d,]+\.\d{2})\s+"
-                r"(?P<bidder>[A-Z][A-Z0-9&.,'\- ]{3,})"
-                r"(?:\s+(?P<location>[A-Z][A-Z .\-]+,\s*[A-Z]{2}))?$"
-            ),
-        ]
-
         for line in lines:
             if not line:
                 continue
             if self._is_header_line(line):
                 continue
 
-            for pattern in patterns:
+            for pattern in _BIDDER_LINE_PATTERNS:
                 match = pattern.match(line)
                 if not match:
                     continue
 
                 bidder_name = (match.group("bidder") or "").strip()
-                if not bidder_name or not re.search(r"[A-Z]", bidder_name):
+                if not bidder_name or not _LETTER_RE.search(bidder_name):
                     continue
 
-                amount = self._parse_amount(match.group("amount"))
+                amount = parse_number(match.group("amount"))
                 if amount is None:
                     continue
 
                 location = (match.groupdict().get("location") or "").strip() or None
-                rank = self._parse_int(match.groupdict().get("rank"))
+                rank = parse_int(match.groupdict().get("rank"))
                 percent_raw = match.groupdict().get("percent")
-                percent_diff = self._parse_percent(percent_raw) or self._parse_percent(line)
+                percent_diff = _parse_percent(percent_raw) or _parse_percent(line)
 
                 bidders.append({
                     "bidder_name": bidder_name,
@@ -145,44 +125,8 @@ class BidSummaryExtractor(BaseExtractor):
 
     def _normalize_line(self, line: str) -> str:
         """Normalize whitespace in a line."""
-        return re.sub(r"\s+", " ", line).strip()
+        return " ".join(line.split())
 
     def _is_header_line(self, line: str) -> bool:
         """Identify header or non-data lines."""
-        header_keywords = [
-            "BID SUMMARY",
-            "CONTRACT",
-            "TOTAL",
-            "ENGINEER",
-            "BIDDER",
-            "BIDDERS",
-            "SUMMARY",
-        ]
-        return any(keyword in line for keyword in header_keywords)
-
-    def _parse_amount(self, value: Optional[str]) -> Optional[float]:
-        """Parse currency amount."""
-        if not value:
-            return None
-        try:
-            return float(value.replace(",", ""))
-        except ValueError:
-            return None
-
-    def _parse_int(self, value: Optional[str]) -> Optional[int]:
-        """Parse int value."""
-        if not value:
-            return None
-        try:
-            return int(value)
-        except ValueError:
-            return None
-
-    def _parse_percent(self, value: Optional[str]) -> Optional[float]:
-        """Parse percentage value."""
-        if not value:
-            return None
-        try:
-            return float(value.replace("%", ""))
-        except ValueError:
-            return None
+        return _HEADER_RE.search(line) is not None
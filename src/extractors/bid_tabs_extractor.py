@@ -4,11 +4,85 @@ from typing import Dict, List, Optional
 
 import pdfplumber
 
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, compile_pattern, parse_number
+
+# Bidder header and total lines, e.g.:
+# RILEY PAVING INC SUPPLY, NC
+# CONTRACT TOTAL 1,387,101.46
+# Name words are matched possessively and stop before the location word (the
+# one followed by a comma), so a failed match cannot backtrack through every
+# split of a long uppercase run. The lookahead keeps the two-character
+# minimum of the original [A-Z][A-Z\s&]+ name. Every start inside a name run
+# ends that run at the same place and so fails the same way; when the row
+# does not match, the second branch consumes the run uncaptured (lastindex is
+# None) so the scan resumes after it rather than retrying each word.
+_BIDDER_NAME = r'[A-Z][A-Z&]*+(?:\s++[A-Z&]++(?!,))*+'
+_BIDDER_RE = re.compile(
+    r'(?=[A-Z](?:[A-Z&]|\s\s|\s++[A-Z&]++(?!,)))'
+    rf'(?:({_BIDDER_NAME})\s++([A-Z]+,\s*[A-Z]{{2}})|{_BIDDER_NAME})'
+)
+_TOTAL_RE = re.compile(r'(?:CONTRACT\s+)?TOTAL\s+([\d,]+\.?\d*)')
+_RANK_SECTION_RE = re.compile(r'BIDDERS IN ORDER.*?CONTRACT TOTAL(.*?)(?:\n\n|\Z)', re.DOTALL)
+# Ranking lines like: "1,387,101.46RILEY PAVING INC 1"
+_RANK_LINE_RE = re.compile(r'([\d,]+\.?\d*)\s*([A-Z\s&]+(?:INC|LLC)?)\s+(\d+)')
+
+# Bid item lines: item number, item code, quantity, then unit/description/prices.
+# Matched over the whole text in MULTILINE mode; every str.splitlines()
+# boundary is first mapped to "\n" and fields are separated by horizontal
+# whitespace only, so a match never spans lines. Leading/trailing whitespace
+# is left outside the groups, as if each line had been stripped.
+_LINE_BREAKS = str.maketrans(dict.fromkeys("\r\v\f\x1c\x1d\x1e\x85\u2028\u2029", "\n"))
+_LINE_RE = re.compile(
+    r"^[^\S\n]*(\d{4})[^\S\n]+(\S+)[^\S\n]+([\d,]+(?:\.\d+)?)[^\S\n]+(.*\S)[^\S\n]*$",
+    re.MULTILINE,
+)
+_PRICE_RE = re.compile(r"[\d,]+\.\d{2}")
+_PRICE_TOKEN = re.compile(r"^[\d,]+\.\d{2}$")
+
+_UNIT_TOKENS = frozenset({
+    "LUMP SUM",
+    "LS",
+    "EA",
+    "TON",
+    "LF",
+    "SY",
+    "CY",
+    "HR",
+    "DAY",
+    "MI",
+    "GAL",
+})
+# Matched against the space-joined non-price tokens; the greedy prefix picks
+# the last unit token, and longer units win at the same position.
+_UNIT_RE = re.compile(
+    r"(?:.* )?(%s)(?: |$)" % "|".join(re.escape(unit) for unit in sorted(_UNIT_TOKENS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+# Bid item table header keywords, most discriminative first
+_ITEM_TABLE_KEYWORDS = ("item", "quantity", "description", "unit", "price", "total")
+
+
+def _extract_tables_range(pdf_path: str, start: int, stop: int) -> List[List]:
+    """Extract pdfplumber tables for pages [start, stop), one list per page."""
+    page_tables = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            page_tables.append(page.extract_tables())
+            # Release the page's cached layout objects as we go
+            page.close()
+    return page_tables
 
 
 class BidTabsExtractor(BaseExtractor):
     """Extract data from Bid Tabs PDFs (tabular data with bids)."""
+
+    FIELD_PATTERNS = {
+        "contract_number": (
+            compile_pattern(r'(DA\d{5})'),
+            compile_pattern(r'(\d{8})'),  # Alternative format
+        ),
+    }
     
     def extract(self) -> Dict:
         """Extract structured data from Bid Tabs.
@@ -16,11 +90,11 @@ class BidTabsExtractor(BaseExtractor):
         Returns:
             Dictionary with bidders and bid items
         """
-        # Try table extraction first (best for structured data)
+        # Try table extraction first (best for structured data). It already
+        # parses bidders, and bid items when no table had any, from the same
+        # cached text, so the regex pass is only needed if it fails outright.
         try:
-            data = self._extract_with_pdfplumber()
-            if data and (data.get("bidders") or data.get("bid_items")):
-                return data
+            return self._extract_with_pdfplumber()
         except Exception as e:
             print(f"PDFPlumber extraction failed: {e}")
         
@@ -29,33 +103,31 @@ class BidTabsExtractor(BaseExtractor):
     
     def _extract_with_pdfplumber(self) -> Dict:
         """Use pdfplumber to extract tables."""
-        bidders = []
         bid_items = []
-        contract_number = None
+
+        # Page text comes from the extractor's single cached PyMuPDF pass;
+        # pdfplumber is only used for table detection.
+        text = self.extract_text()
+        contract_number = self._extract_contract_number(text)
         
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                
-                # Extract contract number from text
-                if not contract_number:
-                    contract_number = self._extract_contract_number(text)
-                
-                # Extract tables
-                tables = page.extract_tables()
+        page_count = len(self._pages_text)
+        if self._use_page_workers(page_count):
+            page_tables = self._extract_pages_parallel(page_count, _extract_tables_range)
+        else:
+            page_tables = _extract_tables_range(str(self.pdf_path), 0, page_count)
+
+        for tables in page_tables:
+            for table in tables:
+                if not table:
+                    continue
                 
-                for table in tables:
-                    if not table:
-                        continue
-                    
-                    # Try to identify table type and parse accordingly
-                    # Bid items table usually has columns like: Item #, Description, Quantity, Unit, Price
-                    if self._is_bid_items_table(table):
-                        items = self._parse_bid_items_table(table)
-                        bid_items.extend(items)
+                # Try to identify table type and parse accordingly
+                # Bid items table usually has columns like: Item #, Description, Quantity, Unit, Price
+                if self._is_bid_items_table(table):
+                    items = self._parse_bid_items_table(table)
+                    bid_items.extend(items)
         
         # Extract bidder summary and bid items from text
-        text = self.extract_text()
         bidders = self._extract_bidders_from_text(text)
         if not bid_items:
             bid_items = self._extract_bid_items_from_text(text)
@@ -78,47 +150,37 @@ class BidTabsExtractor(BaseExtractor):
     
     def _extract_contract_number(self, text: str) -> Optional[str]:
         """Extract contract number."""
-        patterns = [
-            r'(DA\d{5})',
-            r'(\d{8})',  # Alternative format
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        return None
+        return self.match_field(text, "contract_number")
     
     def _extract_bidders_from_text(self, text: str) -> List[Dict]:
         """Extract bidder information from text."""
         bidders = []
         
-        # Look for patterns like:
-        # RILEY PAVING INC SUPPLY, NC
-        # CONTRACT TOTAL 1,387,101.46
-        
         # Extract bidder names and totals
-        bidder_pattern = r'([A-Z][A-Z\s&]+(?:INC|LLC|CO)?)\s+([A-Z]+,\s*[A-Z]{2})'
-        total_pattern = r'(?:CONTRACT\s+)?TOTAL\s+([\d,]+\.?\d*)'
-        
-        bidder_matches = list(re.finditer(bidder_pattern, text))
-        total_matches = list(re.finditer(total_pattern, text))
+        bidder_matches = [match for match in _BIDDER_RE.finditer(text) if match.lastindex]
+
+        # Totals that parse, in document order, so each bidder's total is found
+        # with one pointer walk instead of rescanning every total
+        total_starts = []
+        total_amounts = []
+        for total_match in _TOTAL_RE.finditer(text):
+            try:
+                total_amounts.append(float(total_match.group(1).replace(',', '')))
+            except ValueError:
+                continue
+            total_starts.append(total_match.start())
         
         # Try to match bidders with their totals
+        total_idx = 0
         for i, bidder_match in enumerate(bidder_matches):
             bidder_name = bidder_match.group(1).strip()
             location = bidder_match.group(2).strip()
             
-            # Find corresponding total (next occurrence after bidder name)
-            total_amount = None
-            for total_match in total_matches:
-                if total_match.start() > bidder_match.end():
-                    total_str = total_match.group(1).replace(',', '')
-                    try:
-                        total_amount = float(total_str)
-                        break
-                    except ValueError:
-                        pass
+            # Find corresponding total (next occurrence after bidder name);
+            # bidder matches do not overlap, so their ends only increase
+            while total_idx < len(total_starts) and total_starts[total_idx] <= bidder_match.end():
+                total_idx += 1
+            total_amount = total_amounts[total_idx] if total_idx < len(total_amounts) else None
             
             bidders.append({
                 "bidder_name": bidder_name,
@@ -127,15 +189,16 @@ class BidTabsExtractor(BaseExtractor):
                 "bid_rank": i + 1,
             })
         
-        # Also check for ranking info like "BIDDERS IN ORDER"
-        rank_section = re.search(r'BIDDERS IN ORDER.*?CONTRACT TOTAL(.*?)(?:\n\n|\Z)', text, re.DOTALL)
+        # Also check for ranking info like "BIDDERS IN ORDER". Ranks pair with
+        # bidders by line position, so only the first len(bidders) lines are
+        # split off and searched.
+        rank_section = _RANK_SECTION_RE.search(text) if bidders else None
         if rank_section:
-            lines = rank_section.group(1).strip().split('\n')
-            for idx, line in enumerate(lines):
-                # Parse lines like: "1,387,101.46RILEY PAVING INC 1"
-                match = re.search(r'([\d,]+\.?\d*)\s*([A-Z\s&]+(?:INC|LLC)?)\s+(\d+)', line)
-                if match and idx < len(bidders):
-                    bidders[idx]["bid_rank"] = int(match.group(3))
+            lines = rank_section.group(1).strip().split('\n', len(bidders))
+            for bidder, line in zip(bidders, lines):
+                match = _RANK_LINE_RE.search(line)
+                if match:
+                    bidder["bid_rank"] = int(match.group(3))
         
         return bidders
     
@@ -144,13 +207,21 @@ class BidTabsExtractor(BaseExtractor):
         if not table or len(table) < 2:
             return False
         
-        # Check header row for typical column names
+        # Check header row for typical column names: at least 3 distinct
+        # keywords, stopping as soon as that is reached or no longer possible
         header = ' '.join([str(cell).lower() for cell in table[0] if cell])
         
-        keywords = ['item', 'description', 'quantity', 'unit', 'price', 'total']
-        matches = sum(1 for keyword in keywords if keyword in header)
-        
-        return matches >= 3
+        needed = 3
+        remaining = len(_ITEM_TABLE_KEYWORDS)
+        for keyword in _ITEM_TABLE_KEYWORDS:
+            remaining -= 1
+            if keyword in header:
+                needed -= 1
+                if not needed:
+                    return True
+            elif remaining < needed:
+                return False
+        return False
     
     def _parse_bid_items_table(self, table: List[List]) -> List[Dict]:
         """Parse bid items from table."""
@@ -162,98 +233,55 @@ class BidTabsExtractor(BaseExtractor):
         # Try to identify columns
         header = table[0]
         
-        # Simple heuristic: assume columns are ordered
+        # Simple heuristic: assume columns are ordered. Cells are str/None and
+        # parse_number handles bad values itself, so no row can raise here.
+        parse = parse_number
         for row in table[1:]:
             if not row or not any(row):
                 continue
-            
-            try:
-                item = {
-                    "item_number": str(row[0]) if len(row) > 0 else None,
-                    "description": str(row[1]) if len(row) > 1 else None,
-                    "quantity": self._parse_number(row[2]) if len(row) > 2 else None,
-                    "unit": str(row[3]) if len(row) > 3 else None,
-                    "unit_price": self._parse_number(row[4]) if len(row) > 4 else None,
-                    "total_price": self._parse_number(row[5]) if len(row) > 5 else None,
-                }
-                items.append(item)
-            except Exception:
-                continue
+            n = len(row)
+            items.append({
+                "item_number": str(row[0]),
+                "description": str(row[1]) if n > 1 else None,
+                "quantity": parse(row[2]) if n > 2 else None,
+                "unit": str(row[3]) if n > 3 else None,
+                "unit_price": parse(row[4]) if n > 4 else None,
+                "total_price": parse(row[5]) if n > 5 else None,
+            })
         
         return items
     
-    def _parse_number(self, value) -> Optional[float]:
-        """Parse number from string."""
-        if value is None:
-            return None
-        
-        try:
-            # Remove commas and convert
-            num_str = str(value).replace(',', '').strip()
-            return float(num_str)
-        except (ValueError, AttributeError):
-            return None
-
     def _extract_bid_items_from_text(self, text: str) -> List[Dict]:
         """Extract bid items from text lines when tables are not detected."""
         if not text:
             return []
 
-        unit_tokens = {
-            "LUMP SUM",
-            "LS",
-            "EA",
-            "TON",
-            "LF",
-            "SY",
-            "CY",
-            "HR",
-            "DAY",
-            "MI",
-            "GAL",
-        }
-
         items: List[Dict] = []
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        for line in lines:
-            match = re.match(r"^(\d{4})\s+(\S+)\s+([\d,]+(?:\.\d+)?)\s+(.+)$", line)
-            if not match:
-                continue
-
+        parse = parse_number
+        for match in _LINE_RE.finditer(text.translate(_LINE_BREAKS)):
             item_number = match.group(1)
             item_code = match.group(2)
-            quantity = self._parse_number(match.group(3))
+            quantity = parse(match.group(3))
             remainder = match.group(4)
 
             unit = None
-            prices = [self._parse_number(p) for p in re.findall(r"[\d,]+\.\d{2}", remainder)]
-            prices = [p for p in prices if p is not None]
+            # Every [\d,]+\.\d{2} match is a valid float once commas are removed
+            prices = [float(price.replace(',', '')) for price in _PRICE_RE.findall(remainder)]
 
-            tokens = remainder.split()
-            tokens_without_prices = [t for t in tokens if not re.match(r"^[\d,]+\.\d{2}$", t)]
+            remaining = " ".join(t for t in remainder.split() if not _PRICE_TOKEN.match(t))
 
             # Identify unit token (prefer last occurrence)
-            if tokens_without_prices:
-                idx = len(tokens_without_prices) - 1
-                while idx >= 0:
-                    candidate = " ".join(tokens_without_prices[idx:idx + 2]).upper()
-                    single = tokens_without_prices[idx].upper()
-                    if candidate in unit_tokens:
-                        unit = candidate.title()
-                        del tokens_without_prices[idx:idx + 2]
-                        break
-                    if single in unit_tokens:
-                        unit = single.title()
-                        del tokens_without_prices[idx]
-                        break
-                    idx -= 1
+            unit_match = _UNIT_RE.match(remaining)
+            if unit_match:
+                unit = unit_match.group(1).title()
+                remaining = remaining[:unit_match.start(1)] + remaining[unit_match.end(1):]
 
-            description = " ".join(tokens_without_prices).strip() if tokens_without_prices else None
+            description = " ".join(remaining.split()) or None
 
             item = {
                 "item_number": item_number,
                 "item_code": item_code,
-                "description": description.strip() if description else None,
+                "description": description,
                 "quantity": quantity,
                 "unit": unit,
                 "unit_price": prices[0] if prices else None,
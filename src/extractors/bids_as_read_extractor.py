@@ -2,15 +2,51 @@
 import re
 from typing import Dict, List, Optional
 
-import fitz
-import pdfplumber
-
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, compile_pattern, parse_int, parse_number
+
+_BIDDER = r"[A-Z][A-Z0-9&.,'\- ]{3,}"
+_LOCATION = r"[A-Z][A-Z .\-]+, ?[A-Z]{2}"
+_AMOUNT = r"[\d,]+\.\d{2}"
+
+# Both bidder row layouts in one pass over the normalized text (one line per
+# row, single spaces, so no whitespace class can run across lines):
+#   BIDDER LOCATION, ST 1,234.56 [RANK]
+#   1,234.56 BIDDER [LOCATION, ST]
+_BIDDER_ROW_RE = re.compile(
+    rf"^(?:(?P<bidder>{_BIDDER}) (?P<location>{_LOCATION}) (?P<amount>{_AMOUNT})(?: (?P<rank>\d+))?"
+    rf"|(?P<amount_first>{_AMOUNT}) (?P<bidder_after>{_BIDDER})(?: (?P<location_after>{_LOCATION}))?)$",
+    re.MULTILINE,
+)
+# Header/non-data lines contain any of these ("BIDDERS" is covered by "BIDDER");
+# one alternation search instead of a substring test per keyword
+_HEADER_RE = re.compile("|".join(map(re.escape, (
+    "BIDS AS READ", "BID SUMMARY", "CONTRACT", "TOTAL", "ENGINEER", "BIDDER",
+))))
+_LETTER_RE = re.compile(r"[A-Z]")
+_PERCENT_RE = re.compile(r"([-+]?\d+(?:\.\d+)?)\s*%")
+
+
+def _parse_percent(line: str) -> Optional[float]:
+    """Extract percentage value if present in line."""
+    match = _PERCENT_RE.search(line)
+    if not match:
+        return None
+    try:
+        return float(match.group(1))
+    except ValueError:
+        return None
 
 
 class BidsAsReadExtractor(BaseExtractor):
     """Extract data from Bids As Read PDFs."""
 
+    FIELD_PATTERNS = {
+        "contract_number": (
+            compile_pattern(r"(DA\d{5})", re.IGNORECASE),
+            compile_pattern(r"\b(\d{8})\b", re.IGNORECASE),
+        ),
+    }
+
     def extract(self) -> Dict:
         """Extract structured data from Bids As Read.
 
@@ -28,54 +64,12 @@ class BidsAsReadExtractor(BaseExtractor):
             "bid_items": [],
         }
 
-    def _extract_text_any(self) -> str:
-        """Try multiple text extraction strategies."""
-        text = ""
-        try:
-            text = self.extract_text() or ""
-        except Exception:
-            text = ""
-
-        if text.strip():
-            return text
-
-        try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                parts = [page.extract_text() or "" for page in pdf.pages]
-            text = "\n".join(parts)
-        except Exception:
-            text = ""
-
-        if text.strip():
-            return text
-
-        try:
-            doc = fitz.open(self.pdf_path)
-            parts = [page.get_text() or "" for page in doc]
-            text = "\n".join(parts)
-        except Exception:
-            text = ""
-
-        return text
-
     def _extract_contract_number(self, text: str) -> Optional[str]:
         """Extract contract number from text or filename."""
-        patterns = [
-            r"(DA\d{5})",
-            r"\b(\d{8})\b",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
-
-        filename = self.pdf_name.upper()
-        for pattern in patterns:
-            match = re.search(pattern, filename)
-            if match:
-                return match.group(1).upper()
-
-        return None
+        return (
+            self.match_field(text, "contract_number", str.upper)
+            or self.match_field(self.pdf_name.upper(), "contract_number", str.upper)
+        )
 
     def _extract_bidders(self, text: str) -> List[Dict]:
         """Extract bidder names and amounts from text."""
@@ -83,52 +77,35 @@ class BidsAsReadExtractor(BaseExtractor):
         if not text:
             return bidders
 
-        lines = [self._normalize_line(line) for line in text.splitlines()]
-
-        patterns = [
-            re.compile(
-                r"^(?P<bidder>[A-Z][A-Z0-9&.,'\- ]{3,})\s+"
-                r"(?P<location>[A-Z][A-Z .\-]+,\s*[A-Z]{2})\s+"
-                r"(?P<amount>[\d,]+\.\d{2})(?:\s+(?P<rank>\d+))?$"
-            ),
-            re.compile(
-                r"^(?P<amount>[\d,]+\.\d{2})\s+"
-                r"(?P<bidder>[A-Z][A-Z0-9&.,'\- ]{3,})"
-                r"(?:\s+(?P<location>[A-Z][A-Z .\-]+,\s*[A-Z]{2}))?$"
-            ),
-        ]
-
-        for line in lines:
-            if not line:
-                continue
+        normalized = "\n".join(self._normalize_line(line) for line in text.splitlines())
+
+        for match in _BIDDER_ROW_RE.finditer(normalized):
+            line = match.group(0)
             if self._is_header_line(line):
                 continue
 
-            for pattern in patterns:
-                match = pattern.match(line)
-                if not match:
-                    continue
-
-                bidder_name = (match.group("bidder") or "").strip()
-                if not bidder_name or not re.search(r"[A-Z]", bidder_name):
-                    continue
+            if match.group("bidder") is not None:
+                bidder_name, amount_str, location, rank_str = match.group("bidder", "amount", "location", "rank")
+            else:
+                bidder_name, amount_str, location, rank_str = match.group(
+                    "bidder_after", "amount_first", "location_after", "rank"
+                )
 
-                amount = self._parse_amount(match.group("amount"))
-                if amount is None:
-                    continue
+            bidder_name = bidder_name.strip()
+            if not bidder_name or not _LETTER_RE.search(bidder_name):
+                continue
 
-                location = (match.groupdict().get("location") or "").strip() or None
-                rank = self._parse_int(match.groupdict().get("rank"))
-                percent_diff = self._parse_percent(line)
+            amount = parse_number(amount_str)
+            if amount is None:
+                continue
 
-                bidders.append({
-                    "bidder_name": bidder_name,
-                    "bidder_location": location,
-                    "total_bid_amount": amount,
-                    "bid_rank": rank,
-                    "percentage_diff": percent_diff,
-                })
-                break
+            bidders.append({
+                "bidder_name": bidder_name,
+                "bidder_location": (location or "").strip() or None,
+                "total_bid_amount": amount,
+                "bid_rank": parse_int(rank_str),
+                "percentage_diff": _parse_percent(line),
+            })
 
         for idx, bidder in enumerate(bidders, 1):
             if bidder.get("bid_rank") is None:
@@ -138,45 +115,8 @@ class BidsAsReadExtractor(BaseExtractor):
 
     def _normalize_line(self, line: str) -> str:
         """Normalize whitespace in a line."""
-        return re.sub(r"\s+", " ", line).strip()
+        return " ".join(line.split())
 
     def _is_header_line(self, line: str) -> bool:
         """Identify header or non-data lines."""
-        header_keywords = [
-            "BIDS AS READ",
-            "BID SUMMARY",
-            "CONTRACT",
-            "TOTAL",
-            "ENGINEER",
-            "BIDDER",
-            "BIDDERS",
-        ]
-        return any(keyword in line for keyword in header_keywords)
-
-    def _parse_amount(self, value: Optional[str]) -> Optional[float]:
-        """Parse currency amount."""
-        if not value:
-            return None
-        try:
-            return float(value.replace(",", ""))
-        except ValueError:
-            return None
-
-    def _parse_int(self, value: Optional[str]) -> Optional[int]:
-        """Parse int value."""
-        if not value:
-            return None
-        try:
-            return int(value)
-        except ValueError:
-            return None
-
-    def _parse_percent(self, line: str) -> Optional[float]:
-        """Extract percentage value if present in line."""
-        match = re.search(r"([-+]?\d+(?:\.\d+)?)\s*%", line)
-        if not match:
-            return None
-        try:
-            return float(match.group(1))
-        except ValueError:
-            return None
+        return _HEADER_RE.search(line) is not None
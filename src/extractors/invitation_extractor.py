@@ -1,13 +1,70 @@
 """Extractor for Invitation to Bid documents."""
 import re
-from datetime import datetime
 from typing import Dict, Optional
 
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, compile_pattern, parse_date, parse_datetime
 
 
 class InvitationToBidExtractor(BaseExtractor):
     """Extract data from Invitation to Bid PDFs."""
+
+    FIELD_PATTERNS = {
+        "contract_number": (
+            compile_pattern(r'(DA\d{5})', re.IGNORECASE),
+            compile_pattern(r'Contract No\.?\s*:?\s*(DA\d{5})', re.IGNORECASE),
+            compile_pattern(r'project in Division One:\s*\n?\s*(DA\d{5})', re.IGNORECASE),
+        ),
+        "wbs_element": (
+            compile_pattern(r'WBS Element:\s*([^\n]+)', re.IGNORECASE),
+            compile_pattern(r'WBS\s*Element\s*:?\s*([^\n]+)', re.IGNORECASE),
+        ),
+        "counties": (
+            compile_pattern(r'in\s+([A-Za-z,\s&]+)\s+Count(?:y|ies)', re.IGNORECASE),
+            compile_pattern(r'County:\s*([^\n]+)', re.IGNORECASE),
+        ),
+        "description": (
+            # Try to find description after contract number
+            compile_pattern(r'DA\d{5}\s*[–-]\s*([^\n]+(?:\n[^\n]+)?)', re.IGNORECASE),
+            compile_pattern(r'Description:\s*([^\n]+)', re.IGNORECASE),
+        ),
+        "date_available": (
+            compile_pattern(r'Date of Availability[^\n]*?is\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
+            compile_pattern(r'The Date of Availability[^\n]*?is\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
+        ),
+        "completion_date": (
+            compile_pattern(r'Completion Date[^\n]*?is\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
+            compile_pattern(r'The Completion Date[^\n]*?is\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
+        ),
+        "mbe_goal": (
+            compile_pattern(r'Minority Business Enterprise Goal\s*=\s*(\d+\.?\d*)%?', re.IGNORECASE),
+            compile_pattern(r'MBE Goal\s*=\s*(\d+\.?\d*)%?', re.IGNORECASE),
+        ),
+        "wbe_goal": (
+            compile_pattern(r'Women Business Enterprise Goal\s*=\s*(\d+\.?\d*)%?', re.IGNORECASE),
+            compile_pattern(r'WBE Goal\s*=\s*(\d+\.?\d*)%?', re.IGNORECASE),
+        ),
+        "combined_goal": (
+            compile_pattern(r'Combined MBE/WBE Goal\s*=\s*(\d+\.?\d*)%?', re.IGNORECASE),
+        ),
+        "bid_opening_date": (
+            compile_pattern(r'Bid Opening will be at\s+(\d{1,2}:\d{2}\s*[ap]m)\s+on\s+([A-Za-z]+day)\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
+            compile_pattern(r'(\d{1,2}:\d{2}\s*[AP]M)\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
+        ),
+    }
+    # Leading pages searched before the rest of the document
+    COVER_PAGES = 2
+    # The bid opening time has no fixed literal (its fallback is any "HH:MM AM")
+    FIELD_LITERALS = {
+        "contract_number": ('da',),
+        "wbs_element": ('wbs',),
+        "counties": ('count',),
+        "description": ('da', 'description:'),
+        "date_available": ('date of availability',),
+        "completion_date": ('completion date',),
+        "mbe_goal": ('minority business enterprise goal', 'mbe goal'),
+        "wbe_goal": ('women business enterprise goal', 'wbe goal'),
+        "combined_goal": ('combined mbe/wbe goal',),
+    }
     
     def extract(self) -> Dict:
         """Extract structured data from Invitation to Bid.
@@ -16,152 +73,78 @@ class InvitationToBidExtractor(BaseExtractor):
             Dictionary with contract information
         """
         text = self.extract_text()
+        # Header fields are printed on the cover pages: search those first and
+        # only fall back to the full text for fields they do not contain
+        cover = "".join(f"{page_text}\n" for page_text in self._pages_text[:self.COVER_PAGES])
+        # Lowered once per text for the literal pre-checks (all patterns are case-insensitive)
+        cover_lowered = cover.lower()
+        text_lowered = None
+        
+        def find(extract_field):
+            nonlocal text_lowered
+            value = extract_field(cover, cover_lowered)
+            if value is None and len(cover) < len(text):
+                if text_lowered is None:
+                    text_lowered = text.lower()
+                value = extract_field(text, text_lowered)
+            return value
         
         data = {
-            "contract_number": self._extract_contract_number(text),
-            "wbs_element": self._extract_wbs_element(text),
-            "counties": self._extract_counties(text),
-            "description": self._extract_description(text),
-            "date_available": self._extract_date_available(text),
-            "completion_date": self._extract_completion_date(text),
-            "mbe_goal": self._extract_mbe_goal(text),
-            "wbe_goal": self._extract_wbe_goal(text),
-            "combined_goal": self._extract_combined_goal(text),
-            "bid_opening_date": self._extract_bid_opening_date(text),
+            "contract_number": find(self._extract_contract_number),
+            "wbs_element": find(self._extract_wbs_element),
+            "counties": find(self._extract_counties),
+            "description": find(self._extract_description),
+            "date_available": find(self._extract_date_available),
+            "completion_date": find(self._extract_completion_date),
+            "mbe_goal": find(self._extract_mbe_goal),
+            "wbe_goal": find(self._extract_wbe_goal),
+            "combined_goal": find(self._extract_combined_goal),
+            "bid_opening_date": find(lambda source, _: self._extract_bid_opening_date(source)),
         }
         
         return data
     
-    def _extract_contract_number(self, text: str) -> Optional[str]:
+    def _extract_contract_number(self, text: str, lowered: Optional[str] = None) -> Optional[str]:
         """Extract contract number (e.g., DA00564)."""
-        patterns = [
-            r'(DA\d{5})',
-            r'Contract No\.?\s*:?\s*(DA\d{5})',
-            r'project in Division One:\s*\n?\s*(DA\d{5})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
-        return None
+        return self.match_field(text, "contract_number", str.upper, lowered)
     
-    def _extract_wbs_element(self, text: str) -> Optional[str]:
+    def _extract_wbs_element(self, text: str, lowered: Optional[str] = None) -> Optional[str]:
         """Extract WBS Element."""
-        patterns = [
-            r'WBS Element:\s*([^\n]+)',
-            r'WBS\s*Element\s*:?\s*([^\n]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
+        return self.match_field(text, "wbs_element", str.strip, lowered)
     
-    def _extract_counties(self, text: str) -> Optional[str]:
+    def _extract_counties(self, text: str, lowered: Optional[str] = None) -> Optional[str]:
         """Extract county/counties information."""
-        patterns = [
-            r'in\s+([A-Za-z,\s&]+)\s+Count(?:y|ies)',
-            r'County:\s*([^\n]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
+        return self.match_field(text, "counties", str.strip, lowered)
     
-    def _extract_description(self, text: str) -> Optional[str]:
+    def _extract_description(self, text: str, lowered: Optional[str] = None) -> Optional[str]:
         """Extract project description."""
-        # Try to find description after contract number
-        patterns = [
-            r'DA\d{5}\s*[–-]\s*([^\n]+(?:\n[^\n]+)?)',
-            r'Description:\s*([^\n]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                desc = match.group(1).strip()
-                # Clean up multi-line descriptions
-                desc = re.sub(r'\s+', ' ', desc)
-                return desc[:500]  # Limit length
-        return None
+        # Clean up multi-line descriptions and limit length
+        return self.match_field(text, "description", lambda desc: " ".join(desc.split())[:500], lowered)
     
-    def _extract_date_available(self, text: str) -> Optional[str]:
+    def _extract_date_available(self, text: str, lowered: Optional[str] = None) -> Optional[str]:
         """Extract Date of Availability."""
-        patterns = [
-            r'Date of Availability[^\n]*?is\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-            r'The Date of Availability[^\n]*?is\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return self._parse_date(match.group(1))
-        return None
+        return self.match_field(text, "date_available", self._parse_date, lowered)
     
-    def _extract_completion_date(self, text: str) -> Optional[str]:
+    def _extract_completion_date(self, text: str, lowered: Optional[str] = None) -> Optional[str]:
         """Extract Completion Date."""
-        patterns = [
-            r'Completion Date[^\n]*?is\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-            r'The Completion Date[^\n]*?is\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return self._parse_date(match.group(1))
-        return None
+        return self.match_field(text, "completion_date", self._parse_date, lowered)
     
-    def _extract_mbe_goal(self, text: str) -> Optional[float]:
+    def _extract_mbe_goal(self, text: str, lowered: Optional[str] = None) -> Optional[float]:
         """Extract Minority Business Enterprise Goal."""
-        patterns = [
-            r'Minority Business Enterprise Goal\s*=\s*(\d+\.?\d*)%?',
-            r'MBE Goal\s*=\s*(\d+\.?\d*)%?',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return float(match.group(1))
-        return None
+        return self.match_field(text, "mbe_goal", float, lowered)
     
-    def _extract_wbe_goal(self, text: str) -> Optional[float]:
+    def _extract_wbe_goal(self, text: str, lowered: Optional[str] = None) -> Optional[float]:
         """Extract Women Business Enterprise Goal."""
-        patterns = [
-            r'Women Business Enterprise Goal\s*=\s*(\d+\.?\d*)%?',
-            r'WBE Goal\s*=\s*(\d+\.?\d*)%?',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return float(match.group(1))
-        return None
+        return self.match_field(text, "wbe_goal", float, lowered)
     
-    def _extract_combined_goal(self, text: str) -> Optional[float]:
+    def _extract_combined_goal(self, text: str, lowered: Optional[str] = None) -> Optional[float]:
         """Extract Combined MBE/WBE Goal."""
-        patterns = [
-            r'Combined MBE/WBE Goal\s*=\s*(\d+\.?\d*)%?',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return float(match.group(1))
-        return None
+        return self.match_field(text, "combined_goal", float, lowered)
     
     def _extract_bid_opening_date(self, text: str) -> Optional[str]:
         """Extract Bid Opening date and time."""
-        patterns = [
-            r'Bid Opening will be at\s+(\d{1,2}:\d{2}\s*[ap]m)\s+on\s+([A-Za-z]+day)\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-            r'(\d{1,2}:\d{2}\s*[AP]M)\s+([A-Za-z]+\s+\d{1,2},?\s+\d{4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.FIELD_PATTERNS["bid_opening_date"]:
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) >= 3:
                     time_str = match.group(1)
@@ -174,40 +157,10 @@ class InvitationToBidExtractor(BaseExtractor):
     
     def _parse_date(self, date_str: str) -> Optional[str]:
         """Parse date string to ISO format."""
-        date_str = date_str.replace(',', '').strip()
-        
-        formats = [
-            "%B %d %Y",
-            "%b %d %Y",
-            "%m/%d/%Y",
-            "%Y-%m-%d",
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        return None
+        parsed = parse_date(date_str)
+        return parsed.strftime("%Y-%m-%d") if parsed else None
     
     def _parse_datetime(self, date_str: str, time_str: str) -> Optional[str]:
         """Parse datetime string to ISO format."""
-        date_str = date_str.replace(',', '').strip()
-        time_str = time_str.strip().upper()
-        
-        datetime_str = f"{date_str} {time_str}"
-        
-        formats = [
-            "%B %d %Y %I:%M %p",
-            "%b %d %Y %I:%M %p",
-            "%m/%d/%Y %I:%M %p",
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(datetime_str, fmt)
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                continue
-        return None
+        parsed = parse_datetime(date_str, time_str)
+        return parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else None
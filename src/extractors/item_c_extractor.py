@@ -2,11 +2,63 @@
 import re
 from typing import Dict, List, Optional
 
-from .base_extractor import BaseExtractor
+from .base_extractor import BaseExtractor, compile_pattern, parse_date
+
+
+# Bidder comparison rows, e.g.:
+# STEVENS TOWING CO INC  YONGES ISLAND, SC 2,220,630.54 -15.9
+# Name words are matched possessively; a word only joins the name if another
+# word, a comma that starts the location (not the amount) or a wide gap
+# follows it, leaving the location to the second group. This avoids
+# backtracking through every split of a long uppercase run. A one-letter name
+# takes one trailing blank, as the original [A-Z][A-Z\s&]+ name had to, and
+# the location ends on a letter or comma (or is a lone blank) so the gap
+# before the amount is scanned once. Starts later in a failed name run, or
+# past the last comma of the location run after it, fail the same way; the
+# second branch consumes that stretch uncaptured (lastindex is None) so the
+# scan resumes after it.
+#
+# Against the original pattern the parsed rows are the same; the original
+# could also match rows whose amount is only commas. Those never parsed, but
+# they took a bid_rank, so ranks after such a row are now one lower.
+_NAME_WORD = r'\s++[A-Z&]++(?=\s++(?:[A-Z&]|,++[A-Z\s])|\s{3})'
+_BIDDER_NAME = rf'(?>[A-Z](?:[A-Z&]++(?:{_NAME_WORD})*+|(?:{_NAME_WORD})++|\s))'
+_BIDDER_ROW_RE = re.compile(
+    rf'(?:({_BIDDER_NAME})\s([A-Z\s,]*[A-Z,]|\s(?=\s))'
+    r'\s++([\d,]+\.?\d*)\s++([-+]?\d+\.?\d*)'
+    rf'|{_BIDDER_NAME}(?:\s[A-Z\s,]*,)?)'
+)
 
 
 class ItemCExtractor(BaseExtractor):
     """Extract data from Item C Report PDFs."""
+
+    FIELD_PATTERNS = {
+        "contract_number": (
+            compile_pattern(r'^(DA\d{5})', re.MULTILINE),
+            compile_pattern(r'(DA\d{5})', re.MULTILINE),
+            compile_pattern(r'(\d{8})', re.MULTILINE),
+        ),
+        "proposal_length": (
+            compile_pattern(r'PROPOSAL LENGTH\s+([\d.]+)\s+MILES', re.IGNORECASE),
+            compile_pattern(r'([\d.]+)\s+MILES', re.IGNORECASE),
+        ),
+        "type_of_work": (
+            compile_pattern(r'TYPE OF WORK\s+([^\n]+)', re.IGNORECASE),
+        ),
+        "location": (
+            compile_pattern(r'LOCATION\s+([^\n]+)', re.IGNORECASE),
+        ),
+        "estimated_cost": (
+            compile_pattern(r'ESTIMATE\s+([\d,]+\.?\d*)', re.IGNORECASE),
+        ),
+        "date_available": (
+            compile_pattern(r'DATE AVAILABLE\s+([A-Z]{3}\s+\d{2}\s+\d{4})', re.IGNORECASE),
+        ),
+        "completion_date": (
+            compile_pattern(r'FINAL COMPLETION\s+([A-Z]{3}\s+\d{2}\s+\d{4})', re.IGNORECASE),
+        ),
+    }
     
     def extract(self) -> Dict:
         """Extract structured data from Item C Report.
@@ -31,107 +83,37 @@ class ItemCExtractor(BaseExtractor):
     
     def _extract_contract_number(self, text: str) -> Optional[str]:
         """Extract contract number."""
-        patterns = [
-            r'^(DA\d{5})',
-            r'(DA\d{5})',
-            r'(\d{8})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.MULTILINE)
-            if match:
-                return match.group(1)
-        return None
+        return self.match_field(text, "contract_number")
     
     def _extract_proposal_length(self, text: str) -> Optional[float]:
         """Extract proposal length in miles."""
-        patterns = [
-            r'PROPOSAL LENGTH\s+([\d.]+)\s+MILES',
-            r'([\d.]+)\s+MILES',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    return float(match.group(1))
-                except ValueError:
-                    pass
-        return None
+        return self.match_field(text, "proposal_length", float)
     
     def _extract_type_of_work(self, text: str) -> Optional[str]:
         """Extract type of work."""
-        patterns = [
-            r'TYPE OF WORK\s+([^\n]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
+        return self.match_field(text, "type_of_work", str.strip)
     
     def _extract_location(self, text: str) -> Optional[str]:
         """Extract location/description."""
-        patterns = [
-            r'LOCATION\s+([^\n]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        return None
+        return self.match_field(text, "location", str.strip)
     
     def _extract_estimated_cost(self, text: str) -> Optional[float]:
         """Extract estimated cost."""
-        patterns = [
-            r'ESTIMATE\s+([\d,]+\.?\d*)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount_str = match.group(1).replace(',', '')
-                try:
-                    return float(amount_str)
-                except ValueError:
-                    pass
-        return None
+        return self.match_field(text, "estimated_cost", lambda amount: float(amount.replace(',', '')))
     
     def _extract_date_available(self, text: str) -> Optional[str]:
         """Extract date available."""
-        patterns = [
-            r'DATE AVAILABLE\s+([A-Z]{3}\s+\d{2}\s+\d{4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return self._parse_date(match.group(1))
-        return None
+        return self.match_field(text, "date_available", self._parse_date)
     
     def _extract_completion_date(self, text: str) -> Optional[str]:
         """Extract final completion date."""
-        patterns = [
-            r'FINAL COMPLETION\s+([A-Z]{3}\s+\d{2}\s+\d{4})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return self._parse_date(match.group(1))
-        return None
+        return self.match_field(text, "completion_date", self._parse_date)
     
     def _extract_bidders(self, text: str) -> List[Dict]:
         """Extract bidder comparison data."""
         bidders = []
         
-        # Look for pattern like:
-        # STEVENS TOWING CO INC  YONGES ISLAND, SC 2,220,630.54 -15.9
-        pattern = r'([A-Z][A-Z\s&]+(?:INC|LLC|CO)?)\s+([A-Z\s,]+)\s+([\d,]+\.?\d*)\s+([-+]?\d+\.?\d*)'
-        
-        matches = re.finditer(pattern, text)
+        matches = (match for match in _BIDDER_ROW_RE.finditer(text) if match.lastindex)
         
         for idx, match in enumerate(matches, 1):
             bidder_name = match.group(1).strip()
@@ -157,20 +139,5 @@ class ItemCExtractor(BaseExtractor):
     
     def _parse_date(self, date_str: str) -> Optional[str]:
         """Parse date string to ISO format."""
-        from datetime import datetime
-        
-        date_str = date_str.strip()
-        
-        formats = [
-            "%b %d %Y",
-            "%B %d %Y",
-            "%m/%d/%Y",
-        ]
-        
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        return None
+        parsed = parse_date(date_str)
+        return parsed.strftime("%Y-%m-%d") if parsed else None
@@ -1,18 +1,37 @@
 """S3 ingestor for raw PDFs."""
 from __future__ import annotations
 
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
 except ImportError:  # pragma: no cover - optional for tests
     boto3 = None
 import structlog
 
 logger = structlog.get_logger()
 
+# Objects above PART_SIZE are downloaded as parallel ranged GETs of
+# PART_SIZE each, PART_CONCURRENCY at a time per object
+PART_SIZE = 8 * 1024 * 1024
+PART_CONCURRENCY = 4
+# Smaller objects skip the transfer manager and are streamed with a single
+# GET in STREAM_CHUNK reads (or one read/write when they fit in one chunk)
+STREAM_CHUNK = 1024 * 1024
+# Append-only checkpoint in local_dir: one {"key", "etag", "size"} line per
+# completed download (the last line for a key wins). Used to skip unchanged
+# objects on the next run, including after an interrupted one.
+MANIFEST_NAME = ".s3_manifest.jsonl"
+
 
 @dataclass
 class IngestedFile:
@@ -30,41 +49,119 @@ class S3Ingestor:
         local_dir: Path,
         max_items: Optional[int] = None,
         s3_client=None,
+        max_workers: int = 32,
     ) -> None:
         self.bucket = bucket
         self.raw_prefix = raw_prefix
         self.local_dir = Path(local_dir)
         self.max_items = max_items
+        self.max_workers = max(1, max_workers)
+        self._manifest_lock = threading.Lock()
         if s3_client is None and boto3 is None:
             raise ImportError("boto3 is required for S3 ingestion")
-        self.s3 = s3_client or boto3.client("s3")
+        # Enough pooled connections for every download thread to fetch all
+        # of its parts at once (botocore defaults to 10)
+        self.s3 = s3_client or boto3.client(
+            "s3", config=Config(max_pool_connections=max(10, self.max_workers * PART_CONCURRENCY))
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=PART_SIZE,
+            multipart_chunksize=PART_SIZE,
+            max_concurrency=PART_CONCURRENCY,
+        ) if boto3 is not None else None
 
     def list_pdf_keys(self) -> List[str]:
         """List PDF keys under the raw prefix."""
+        return [item["Key"] for item in self._list_pdf_objects()]
+
+    def _list_pdf_objects(self) -> List[dict]:
+        """List PDF object entries (Key, ETag, Size, ...) under the raw prefix."""
         paginator = self.s3.get_paginator("list_objects_v2")
-        keys: List[str] = []
+        objects: List[dict] = []
         for page in paginator.paginate(Bucket=self.bucket, Prefix=self.raw_prefix):
             for item in page.get("Contents", []):
                 key = item.get("Key", "")
                 if key.lower().endswith(".pdf"):
-                    keys.append(key)
-                if self.max_items and len(keys) >= self.max_items:
-                    return keys
-        return keys
+                    objects.append(item)
+                if self.max_items and len(objects) >= self.max_items:
+                    return objects
+        return objects
 
     def download_all(self) -> List[IngestedFile]:
-        """Download all PDFs to the local directory."""
+        """Download all PDFs to the local directory.
+
+        Objects whose ETag and size match the manifest from an earlier run,
+        and whose local copy is still present, are not downloaded again.
+        """
         self.local_dir.mkdir(parents=True, exist_ok=True)
-        keys = self.list_pdf_keys()
+        manifest = self._load_manifest()
         ingested: List[IngestedFile] = []
-        for key in keys:
-            filename = Path(key).name
-            local_path = self.local_dir / filename
-            logger.info("Downloading S3 object", key=key, dest=str(local_path))
-            self.s3.download_file(self.bucket, key, str(local_path))
-            ingested.append(IngestedFile(key=key, local_path=local_path))
+        pending: List[Tuple[IngestedFile, dict]] = []
+        for item in self._list_pdf_objects():
+            ingested_file = IngestedFile(key=item["Key"], local_path=self.local_dir / Path(item["Key"]).name)
+            ingested.append(ingested_file)
+            version = {"etag": item.get("ETag"), "size": item.get("Size")}
+            if (
+                version["etag"]
+                and manifest.get(ingested_file.key) == version
+                and ingested_file.local_path.is_file()
+                and ingested_file.local_path.stat().st_size == version["size"]
+            ):
+                logger.info("Skipping unchanged S3 object", key=ingested_file.key)
+                continue
+            pending.append((ingested_file, version))
+
+        if pending:
+            # Each download is a blocking round-trip; run them concurrently.
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                list(executor.map(lambda job: self._download(*job), pending))
         return ingested
 
+    def _download(self, item: IngestedFile, version: dict) -> None:
+        """Download one object to its local path and checkpoint it."""
+        logger.info("Downloading S3 object", key=item.key, dest=str(item.local_path))
+        size = version.get("size")
+        if size is not None and size < PART_SIZE:
+            self._stream_object(item.key, item.local_path, size)
+        else:
+            self.s3.download_file(self.bucket, item.key, str(item.local_path), Config=self.transfer_config)
+        self._record_download(item.key, version)
+
+    def _stream_object(self, key: str, local_path: Path, size: int) -> None:
+        """Write a single-part object to disk straight from its GET response."""
+        body = self.s3.get_object(Bucket=self.bucket, Key=key)["Body"]
+        try:
+            with open(local_path, "wb", buffering=STREAM_CHUNK) as f:
+                if size <= STREAM_CHUNK:
+                    f.write(body.read())
+                else:
+                    shutil.copyfileobj(body, f, STREAM_CHUNK)
+        finally:
+            body.close()
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        """Read the download checkpoint; unreadable or torn lines are ignored."""
+        manifest: Dict[str, dict] = {}
+        try:
+            with open(self.local_dir / MANIFEST_NAME, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        manifest[entry["key"]] = {"etag": entry["etag"], "size": entry["size"]}
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            pass
+        return manifest
+
+    def _record_download(self, key: str, version: dict) -> None:
+        """Append one completed download to the checkpoint and flush it to disk."""
+        line = json.dumps({"key": key, **version}) + "\n"
+        with self._manifest_lock, open(self.local_dir / MANIFEST_NAME, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
     @staticmethod
     def build_key_map(files: Iterable[IngestedFile]) -> Dict[str, str]:
         """Map local file paths to S3 keys."""
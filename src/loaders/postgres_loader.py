@@ -1,12 +1,19 @@
 """PostgreSQL loader for extracted data."""
+import io
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 import structlog
 from dotenv import load_dotenv
+from sqlalchemy import case, func, insert, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 
 from src.models.database_models import (
@@ -17,14 +24,43 @@ from src.models.database_models import (
     ExtractionLog,
     get_engine,
     get_session,
+    utc_now,
 )
 
 load_dotenv()
 logger = structlog.get_logger()
 
+# Tried in order; the first pattern that matches anywhere in the name wins
+_FILENAME_CONTRACT_PATTERNS = (
+    re.compile(r"(DA\d{5})", re.IGNORECASE),
+    re.compile(r"\b(\d{8})\b", re.IGNORECASE),
+)
+
+# Escapes for COPY's text format (backslash first, so it is not doubled twice)
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# (normalized bidder name, amount to 2 decimals)
+BidderKey = Tuple[str, str]
+
+_worker_loader: Optional["PostgresLoader"] = None
+
+
+def _init_load_worker(database_url: str) -> None:
+    """Open one loader (engine + session) per worker process instead of per task."""
+    global _worker_loader
+    _worker_loader = PostgresLoader(database_url)
+
+
+def _load_group(results: List[Dict]) -> List[bool]:
+    """Load one contract's results in a worker process (module-level so it pickles)."""
+    return _worker_loader._load_results(results)
+
 
 class PostgresLoader:
     """Load extracted data into PostgreSQL database."""
+
+    # Child and log rows are streamed with COPY when the driver supports it (psycopg2)
+    _copy_supported = False
     
     def __init__(self, database_url: Optional[str] = None):
         """Initialize loader.
@@ -38,17 +74,20 @@ class PostgresLoader:
         
         self.engine = get_engine(self.database_url)
         self.session = get_session(self.engine)
+        self._copy_supported = self.engine.dialect.driver == "psycopg2"
     
     def create_tables(self):
         """Create database tables if they don't exist."""
         Base.metadata.create_all(self.engine)
         logger.info("Database tables created/verified")
     
-    def load_contract(self, data: Dict) -> Optional[Contract]:
+    def load_contract(self, data: Dict, commit: bool = True) -> Optional[Contract]:
         """Load contract data.
         
         Args:
             data: Extracted contract data
+            commit: Commit now; if False, only a savepoint is used and the
+                caller commits
             
         Returns:
             Contract object or None if failed
@@ -59,148 +98,304 @@ class PostgresLoader:
                 logger.warning("Contract number missing, skipping")
                 return None
             
-            # Check if contract already exists
-            existing = self.session.query(Contract).filter_by(
-                contract_number=contract_number
-            ).first()
-            
-            if existing:
-                # Update existing record
-                for key, value in data.items():
-                    if hasattr(existing, key) and value is not None:
-                        setattr(existing, key, value)
-                contract = existing
-                logger.info("Contract updated", contract_number=contract_number)
-            else:
-                # Create new record
-                contract = Contract(**data)
-                self.session.add(contract)
-                logger.info("Contract created", contract_number=contract_number)
+            # Insert or update in one atomic round-trip. On conflict, columns
+            # the new extraction left empty keep their stored value, and
+            # updated_at only moves when one of them actually changes.
+            columns = Contract.__table__.c
+            values = {key: value for key, value in data.items() if key in columns}
+            stmt = pg_insert(Contract).values(**values)
+            merged = {key: func.coalesce(stmt.excluded[key], columns[key]) for key in values}
+            changed = tuple_(*(columns[key] for key in merged)).is_distinct_from(tuple_(*merged.values()))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[columns.contract_number],
+                set_={**merged, 'updated_at': case((changed, utc_now()), else_=columns.updated_at)},
+            ).returning(Contract)
+            with self._savepoint(commit):
+                contract = self.session.scalars(
+                    stmt, execution_options={"populate_existing": True}
+                ).one()
             
-            self.session.commit()
+            if commit:
+                self.session.commit()
+            logger.info("Contract upserted", contract_number=contract_number)
             return contract
             
         except Exception as e:
-            self.session.rollback()
+            if commit:
+                self.session.rollback()
             logger.error("Failed to load contract",
                         contract_number=data.get('contract_number'),
                         error=str(e))
             return None
     
-    def load_bidders(self, contract_id: int, bidders: List[Dict]) -> int:
+    def load_bidders(
+        self,
+        contract_id: int,
+        bidders: List[Dict],
+        commit: bool = True,
+        existing_keys: Optional[Set[BidderKey]] = None,
+    ) -> int:
         """Load bidder data for a contract.
         
         Args:
             contract_id: Contract database ID
             bidders: List of bidder dictionaries
+            commit: Commit now (see load_contract)
+            existing_keys: Dedup keys of the contract's stored bidders, if
+                already known (see load_batch); queried otherwise. Keys of
+                the bidders inserted here are added to it.
             
         Returns:
             Number of bidders loaded
         """
-        count = 0
-        existing = self.session.query(Bidder).filter_by(contract_id=contract_id).all()
-        existing_keys = {
-            self._bidder_key(row.bidder_name, row.total_bid_amount) for row in existing
-        }
+        if existing_keys is None:
+            existing = self.session.query(Bidder).filter_by(contract_id=contract_id).all()
+            existing_keys = {
+                self._bidder_key(row.bidder_name, row.total_bid_amount) for row in existing
+            }
         pending_keys = set()
+        rows = []
         for bidder_data in bidders:
+            bidder_key = self._bidder_key(
+                bidder_data.get('bidder_name'),
+                bidder_data.get('total_bid_amount')
+            )
+            if bidder_key in existing_keys or bidder_key in pending_keys:
+                continue
             try:
-                bidder_data['contract_id'] = contract_id
-                bidder_key = self._bidder_key(
-                    bidder_data.get('bidder_name'),
-                    bidder_data.get('total_bid_amount')
-                )
-                if bidder_key in existing_keys or bidder_key in pending_keys:
-                    continue
-                bidder = Bidder(**bidder_data)
-                self.session.add(bidder)
-                pending_keys.add(bidder_key)
-                count += 1
-            except Exception as e:
+                rows.append(self._contract_row(Bidder, bidder_data, contract_id))
+            except ValueError as e:
                 logger.warning("Failed to load bidder",
                              bidder=bidder_data.get('bidder_name'),
                              error=str(e))
+                continue
+            pending_keys.add(bidder_key)
         
-        try:
-            self.session.commit()
-            logger.info(f"Loaded {count} bidders", contract_id=contract_id)
-        except Exception as e:
-            self.session.rollback()
-            logger.error("Failed to commit bidders", error=str(e))
-            count = 0
-        
+        count = self._insert_contract_rows(Bidder, rows, contract_id, "bidders", commit)
+        if count:
+            existing_keys |= pending_keys
         return count
     
-    def load_bid_items(self, contract_id: int, items: List[Dict]) -> int:
+    def _existing_bidder_keys(self, contract_numbers: Set[str]) -> Dict[str, Set[BidderKey]]:
+        """Dedup keys of the stored bidders of each contract, in one query."""
+        keys: Dict[str, Set[BidderKey]] = {number: set() for number in contract_numbers}
+        if not contract_numbers:
+            return keys
+        rows = (
+            self.session.query(Contract.contract_number, Bidder.bidder_name, Bidder.total_bid_amount)
+            .join(Bidder, Bidder.contract_id == Contract.id)
+            .filter(Contract.contract_number.in_(contract_numbers))
+        )
+        for contract_number, bidder_name, total_bid_amount in rows:
+            keys[contract_number].add(self._bidder_key(bidder_name, total_bid_amount))
+        return keys
+    
+    def load_bid_items(self, contract_id: int, items: List[Dict], commit: bool = True) -> int:
         """Load bid items for a contract.
         
         Args:
             contract_id: Contract database ID
             items: List of bid item dictionaries
+            commit: Commit now (see load_contract)
             
         Returns:
             Number of items loaded
         """
-        count = 0
+        rows = []
         for item_data in items:
             try:
-                item_data['contract_id'] = contract_id
-                item = BidItem(**item_data)
-                self.session.add(item)
-                count += 1
-            except Exception as e:
+                rows.append(self._contract_row(BidItem, item_data, contract_id))
+            except ValueError as e:
                 logger.warning("Failed to load bid item",
                              item=item_data.get('item_number'),
                              error=str(e))
         
+        return self._insert_contract_rows(BidItem, rows, contract_id, "bid items", commit)
+    
+    def _contract_row(self, model, data: Dict, contract_id: int) -> Dict:
+        """Copy ``data`` with its contract_id; raises ValueError on unknown columns."""
+        unknown = data.keys() - model.__table__.columns.keys()
+        if unknown:
+            raise ValueError(f"unknown {model.__tablename__} columns: {', '.join(sorted(unknown))}")
+        return {**data, 'contract_id': contract_id}
+    
+    def _insert_contract_rows(
+        self, model, rows: List[Dict], contract_id: int, label: str, commit: bool = True
+    ) -> int:
+        """Insert a contract's child rows with one COPY (or one batched INSERT)."""
+        if not rows:
+            return 0
         try:
-            self.session.commit()
-            logger.info(f"Loaded {count} bid items", contract_id=contract_id)
+            with self._savepoint(commit):
+                if self._copy_supported:
+                    self._copy_rows(model, rows)
+                else:
+                    # executemany: SQLAlchemy batches the rows into multi-VALUES INSERTs
+                    self.session.execute(insert(model), rows)
+            if commit:
+                self.session.commit()
+            logger.info(f"Loaded {len(rows)} {label}", contract_id=contract_id)
+            return len(rows)
         except Exception as e:
-            self.session.rollback()
-            logger.error("Failed to commit bid items", error=str(e))
-            count = 0
-        
-        return count
+            if commit:
+                self.session.rollback()
+            logger.error(f"Failed to commit {label}", error=str(e))
+            return 0
+    
+    def _copy_rows(self, model, rows: List[Dict]) -> None:
+        """Stream rows into ``model``'s table with COPY FROM STDIN (text format).
+
+        Runs on the session's connection, so it is part of the current
+        transaction. Column defaults are filled in here for missing or None
+        values, as the batched INSERT does; COPY bypasses them. Columns with
+        a server default that no row sets are left out, so the server fills
+        them in.
+        """
+        present = set().union(*rows)
+        columns = [
+            column for column in model.__table__.columns
+            if not column.primary_key
+            and (column.server_default is None or column.name in present)
+        ]
+        defaults = {}
+        for column in columns:
+            default = column.default
+            if default is not None and default.is_callable:
+                defaults[column.name] = default.arg(None)
+            elif default is not None and default.is_scalar:
+                defaults[column.name] = default.arg
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(
+                self._copy_value(defaults.get(column.name) if row.get(column.name) is None else row[column.name])
+                for column in columns
+            ))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        names = ", ".join(column.name for column in columns)
+        cursor = self.session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {model.__tablename__} ({names}) FROM STDIN WITH (FORMAT text)", buffer
+            )
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _copy_value(value) -> str:
+        """Render one value as a COPY text-format field."""
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value).translate(_COPY_ESCAPES)
+
+    def _savepoint(self, commit: bool):
+        """Savepoint for a step inside a caller's transaction (nothing if committing).
+
+        A failed step then rolls back only its own writes, not the rest of
+        the caller's transaction.
+        """
+        return nullcontext() if commit else self.session.begin_nested()
     
-    def log_extraction(self, extraction_result: Dict) -> None:
+    def log_extraction(self, extraction_result: Dict, commit: bool = True) -> None:
         """Log extraction results to database.
         
         Args:
             extraction_result: Extraction result dictionary
+            commit: Commit now (see load_contract)
         """
         try:
-            file_mtime = extraction_result.get('metadata', {}).get('file_mtime')
-            file_mtime_dt = self._parse_datetime(file_mtime) if file_mtime else None
-
-            log_data = {
-                'file_path': extraction_result.get('file_path'),
-                'document_type': extraction_result.get('document_type'),
-                'extraction_method': extraction_result.get('metadata', {}).get('extraction_method'),
-                'status': extraction_result.get('status'),
-                'error_message': extraction_result.get('error'),
-                'processing_time_seconds': extraction_result.get('metadata', {}).get('processing_time'),
-                'needs_ocr': extraction_result.get('metadata', {}).get('needs_ocr'),
-                'needs_ocr_reasons': self._format_ocr_reasons(
-                    extraction_result.get('metadata', {}).get('needs_ocr_reasons')
-                ),
-                'ocr_applied': extraction_result.get('metadata', {}).get('ocr_applied'),
-                'ocr_method': extraction_result.get('metadata', {}).get('ocr_method'),
-                'ocr_duration_seconds': extraction_result.get('metadata', {}).get('ocr_duration_seconds'),
-                'file_hash': extraction_result.get('metadata', {}).get('file_hash'),
-                'file_size_bytes': extraction_result.get('metadata', {}).get('file_size_bytes'),
-                'file_mtime': file_mtime_dt,
-                'run_id': extraction_result.get('metadata', {}).get('run_id'),
-            }
-            
-            log = ExtractionLog(**log_data)
-            self.session.add(log)
-            self.session.commit()
+            log = ExtractionLog(**self._build_log_data(extraction_result))
+            with self._savepoint(commit):
+                self.session.add(log)
+            if commit:
+                self.session.commit()
             
         except Exception as e:
-            self.session.rollback()
+            if commit:
+                self.session.rollback()
             logger.error("Failed to log extraction", error=str(e))
 
+    def log_extractions(self, extraction_results: List[Dict], commit: bool = True) -> int:
+        """Log many extraction results with one COPY (or batched INSERT) and one commit.
+
+        If the bulk statement fails (e.g. one row violates a constraint),
+        the rows are retried one at a time so only the offending rows are
+        lost.
+
+        Args:
+            extraction_results: Extraction result dictionaries
+            commit: Commit now (see load_contract)
+
+        Returns:
+            Number of log rows written
+        """
+        if not extraction_results:
+            return 0
+
+        try:
+            rows = [self._build_log_data(result) for result in extraction_results]
+            try:
+                with self.session.begin_nested():
+                    if self._copy_supported:
+                        self._copy_rows(ExtractionLog, rows)
+                    else:
+                        # executemany: SQLAlchemy batches the rows into multi-VALUES INSERTs
+                        self.session.execute(insert(ExtractionLog), rows)
+                written = len(rows)
+            except Exception as e:
+                logger.warning("Bulk extraction log insert failed, retrying row by row",
+                               count=len(rows), error=str(e))
+                written = self._log_rows_one_by_one(rows)
+            if commit:
+                self.session.commit()
+            return written
+        except Exception as e:
+            if commit:
+                self.session.rollback()
+            logger.error("Failed to log extractions", count=len(extraction_results), error=str(e))
+            return 0
+
+    def _log_rows_one_by_one(self, rows: List[Dict]) -> int:
+        """Insert log rows each in its own savepoint; returns how many were written."""
+        written = 0
+        for row in rows:
+            try:
+                with self.session.begin_nested():
+                    self.session.execute(insert(ExtractionLog), [row])
+                written += 1
+            except Exception as e:
+                logger.error("Failed to log extraction", file=row.get('file_path'), error=str(e))
+        return written
+
+    def _build_log_data(self, extraction_result: Dict) -> Dict:
+        """Map an extraction result onto extraction_logs columns."""
+        metadata = extraction_result.get('metadata', {})
+        file_mtime = metadata.get('file_mtime')
+        file_mtime_dt = self._parse_datetime(file_mtime) if file_mtime else None
+
+        return {
+            'file_path': extraction_result.get('file_path'),
+            'document_type': extraction_result.get('document_type'),
+            'extraction_method': metadata.get('extraction_method'),
+            'status': extraction_result.get('status'),
+            'error_message': extraction_result.get('error'),
+            'processing_time_seconds': metadata.get('processing_time'),
+            'needs_ocr': metadata.get('needs_ocr'),
+            'needs_ocr_reasons': self._format_ocr_reasons(metadata.get('needs_ocr_reasons')),
+            'ocr_applied': metadata.get('ocr_applied'),
+            'ocr_method': metadata.get('ocr_method'),
+            'ocr_duration_seconds': metadata.get('ocr_duration_seconds'),
+            'file_hash': metadata.get('file_hash'),
+            'file_size_bytes': metadata.get('file_size_bytes'),
+            'file_mtime': file_mtime_dt,
+            'run_id': metadata.get('run_id'),
+        }
+
     def _parse_datetime(self, value) -> Optional[datetime]:
         """Parse datetime from ISO string or timestamp."""
         if value is None:
@@ -233,94 +428,143 @@ class PostgresLoader:
             return ",".join(str(reason) for reason in reasons)
         return str(reasons)
     
-    def load_extraction_result(self, result: Dict) -> bool:
+    def load_extraction_result(
+        self,
+        result: Dict,
+        log: bool = True,
+        existing_bidder_keys: Optional[Dict[str, Set[BidderKey]]] = None,
+        commit: bool = True,
+    ) -> bool:
         """Load complete extraction result.
         
+        Everything is written in one transaction with a single commit; each
+        step runs in its own savepoint, so a failed step does not undo the
+        others (e.g. the contract is kept if its bidders fail to insert).
+        
         Args:
             result: Full extraction result from pipeline
+            log: Write the extraction log row (load_batch logs in bulk instead)
+            existing_bidder_keys: Stored bidder dedup keys by contract number,
+                preloaded by load_batch
+            commit: Commit now; if False, the result is written in a savepoint
+                and the caller commits (load_batch commits once per batch)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Log extraction
-            self.log_extraction(result)
-            
-            # Only process extractions with data
-            if result.get('status') not in ('success', 'partial') or 'data' not in result:
-                return True  # Logging is success enough for failed extractions
-            
-            data = result['data']
-            
-            # Load contract
-            file_mtime = result.get('metadata', {}).get('file_mtime')
-            file_mtime_dt = self._parse_datetime(file_mtime) if file_mtime else None
-
-            contract_number = data.get('contract_number')
-            if not contract_number:
-                contract_number = self._infer_contract_number_from_file_path(result.get('file_path'))
-
-            contract = self.load_contract({
-                'contract_number': self._normalize_contract_number(contract_number),
-                'wbs_element': data.get('wbs_element'),
-                'counties': data.get('counties'),
-                'description': data.get('description'),
-                'date_available': self._parse_date(data.get('date_available')),
-                'completion_date': self._parse_date(data.get('completion_date')),
-                'mbe_goal': data.get('mbe_goal'),
-                'wbe_goal': data.get('wbe_goal'),
-                'combined_goal': data.get('combined_goal'),
-                'bid_opening_date': self._parse_datetime(data.get('bid_opening_date')),
-                'proposal_length': data.get('proposal_length'),
-                'type_of_work': data.get('type_of_work'),
-                'location': data.get('location'),
-                'estimated_cost': data.get('estimated_cost'),
-                'awarded_amount': data.get('awarded_amount'),
-                'awarded_to': data.get('awarded_to'),
-                'award_date': self._parse_date(data.get('award_date')),
-                'source_file_path': result.get('file_path'),
-                'source_file_hash': result.get('metadata', {}).get('file_hash'),
-                'source_file_mtime': file_mtime_dt,
-                'extraction_run_id': result.get('metadata', {}).get('run_id'),
-            })
-            
-            if not contract:
-                return False
-            
-            # Load bidders if present
-            if 'bidders' in data and data['bidders']:
-                self.load_bidders(contract.id, data['bidders'])
-            
-            # Load bid items if present
-            if 'bid_items' in data and data['bid_items']:
-                self.load_bid_items(contract.id, data['bid_items'])
-            
-            return True
+            with self._savepoint(commit):
+                loaded = self._write_extraction_result(result, log, existing_bidder_keys)
+            if commit:
+                self.session.commit()
+            return loaded
             
         except Exception as e:
+            if commit:
+                self.session.rollback()
             logger.error("Failed to load extraction result",
                         file=result.get('file_path'),
                         error=str(e))
             return False
     
-    def load_batch(self, results: List[Dict]) -> Dict:
+    def _write_extraction_result(
+        self,
+        result: Dict,
+        log: bool,
+        existing_bidder_keys: Optional[Dict[str, Set[BidderKey]]],
+    ) -> bool:
+        """Write one result's rows without committing (see load_extraction_result)."""
+        # Log extraction
+        if log:
+            self.log_extraction(result, commit=False)
+        
+        # Only process extractions with data
+        if result.get('status') not in ('success', 'partial') or 'data' not in result:
+            return True  # Logging is success enough for failed extractions
+        
+        data = result['data']
+        
+        # Load contract
+        file_mtime = result.get('metadata', {}).get('file_mtime')
+        file_mtime_dt = self._parse_datetime(file_mtime) if file_mtime else None
+
+        contract_number = self._result_contract_number(result)
+        contract = self.load_contract({
+            'contract_number': contract_number,
+            'wbs_element': data.get('wbs_element'),
+            'counties': data.get('counties'),
+            'description': data.get('description'),
+            'date_available': self._parse_date(data.get('date_available')),
+            'completion_date': self._parse_date(data.get('completion_date')),
+            'mbe_goal': data.get('mbe_goal'),
+            'wbe_goal': data.get('wbe_goal'),
+            'combined_goal': data.get('combined_goal'),
+            'bid_opening_date': self._parse_datetime(data.get('bid_opening_date')),
+            'proposal_length': data.get('proposal_length'),
+            'type_of_work': data.get('type_of_work'),
+            'location': data.get('location'),
+            'estimated_cost': data.get('estimated_cost'),
+            'awarded_amount': data.get('awarded_amount'),
+            'awarded_to': data.get('awarded_to'),
+            'award_date': self._parse_date(data.get('award_date')),
+            'source_file_path': result.get('file_path'),
+            'source_file_hash': result.get('metadata', {}).get('file_hash'),
+            'source_file_mtime': file_mtime_dt,
+            'extraction_run_id': result.get('metadata', {}).get('run_id'),
+        }, commit=False)
+        
+        if not contract:
+            return False
+        
+        # Load bidders if present
+        if 'bidders' in data and data['bidders']:
+            existing_keys = None
+            if existing_bidder_keys is not None:
+                existing_keys = existing_bidder_keys.setdefault(contract_number, set())
+            self.load_bidders(contract.id, data['bidders'], commit=False, existing_keys=existing_keys)
+        
+        # Load bid items if present
+        if 'bid_items' in data and data['bid_items']:
+            self.load_bid_items(contract.id, data['bid_items'], commit=False)
+        
+        return True
+    
+    def load_batch(self, results: List[Dict], max_workers: int = 1) -> Dict:
         """Load batch of extraction results.
         
         Args:
             results: List of extraction results
+            max_workers: Worker processes (1 loads in-process). Results are
+                grouped by contract so one contract is never loaded by two
+                workers at once (bidder dedup stays consistent).
             
         Returns:
             Summary dictionary with statistics
         """
         total = len(results)
-        successful = 0
-        failed = 0
+
+        groups = self._group_by_contract(results)
+        workers = max(1, min(max_workers, len(groups)))
+
+        # One round-trip for every log row instead of an INSERT + COMMIT each.
+        # Loading in-process, they share the results' single commit.
+        self.log_extractions(results, commit=workers > 1)
         
-        for result in results:
-            if self.load_extraction_result(result):
-                successful += 1
-            else:
-                failed += 1
+        if workers == 1:
+            statuses = self._load_results(results)
+        else:
+            # Pooled connections must not be shared with forked workers
+            self.engine.dispose()
+            logger.info("Loading results in parallel", results=total, contracts=len(groups), workers=workers)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_load_worker,
+                initargs=(self.database_url,),
+            ) as executor:
+                statuses = [ok for group in executor.map(_load_group, groups) for ok in group]
+
+        successful = sum(statuses)
+        failed = total - successful
         
         summary = {
             'total': total,
@@ -331,6 +575,45 @@ class PostgresLoader:
         
         logger.info("Batch loading completed", **summary)
         return summary
+
+    def _load_results(self, results: List[Dict]) -> List[bool]:
+        """Load already-logged results in order, in one transaction.
+
+        Each result is written in its own savepoint, so a bad one is rolled
+        back alone; the rest are committed together at the end.
+
+        Returns:
+            One status per result (all False if the final commit fails)
+        """
+        # One round-trip for the stored bidders of every contract in the batch
+        contract_numbers = {
+            self._result_contract_number(result)
+            for result in results
+            if result.get('status') in ('success', 'partial') and 'data' in result
+        }
+        contract_numbers.discard(None)
+        existing_bidder_keys = self._existing_bidder_keys(contract_numbers)
+        
+        statuses = [
+            self.load_extraction_result(
+                result, log=False, existing_bidder_keys=existing_bidder_keys, commit=False
+            )
+            for result in results
+        ]
+        try:
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            logger.error("Failed to commit loaded results", count=len(results), error=str(e))
+            return [False] * len(results)
+        return statuses
+
+    def _group_by_contract(self, results: List[Dict]) -> List[List[Dict]]:
+        """Split results into per-contract groups, in first-seen order."""
+        groups: Dict[Optional[str], List[Dict]] = {}
+        for result in results:
+            groups.setdefault(self._result_contract_number(result), []).append(result)
+        return list(groups.values())
     
     def _parse_date(self, date_str: Optional[str]):
         """Parse date string to datetime object."""
@@ -348,6 +631,14 @@ class PostgresLoader:
         """Parse datetime string to datetime object."""
         return self._parse_date(datetime_str)
 
+    def _result_contract_number(self, result: Dict) -> Optional[str]:
+        """Normalized contract number of a result (inferred from its file name if missing)."""
+        # Failed extractions carry "data": None
+        contract_number = (result.get('data') or {}).get('contract_number')
+        if not contract_number:
+            contract_number = self._infer_contract_number_from_file_path(result.get('file_path'))
+        return self._normalize_contract_number(contract_number)
+
     def _normalize_contract_number(self, value: Optional[str]) -> Optional[str]:
         """Normalize contract numbers for consistent keys."""
         if not value:
@@ -359,24 +650,28 @@ class PostgresLoader:
         if not file_path:
             return None
 
-        import re
-
         filename = Path(file_path).name
-        patterns = [
-            r"(DA\d{5})",
-            r"\b(\d{8})\b",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
+        for pattern in _FILENAME_CONTRACT_PATTERNS:
+            match = pattern.search(filename)
             if match:
                 return match.group(1).upper()
         return None
 
-    def _bidder_key(self, name, total_amount) -> str:
-        """Build a deduplication key for bidders."""
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _bidder_key(name, total_amount) -> BidderKey:
+        """Build a deduplication key for bidders.
+
+        Amounts are formatted to the column's 2 decimals, so a stored
+        Decimal("100.00") and an extracted 100.0 give the same key.
+        """
         name_key = (name or "").strip().upper()
-        amount_key = str(total_amount) if total_amount is not None else ""
-        return f"{name_key}|{amount_key}"
+        if total_amount is None:
+            return name_key, ""
+        try:
+            return name_key, format(Decimal(str(total_amount)), ".2f")
+        except InvalidOperation:
+            return name_key, str(total_amount)
     
     def close(self):
         """Close database connection."""
@@ -1,19 +1,34 @@
 """S3 loader for processed outputs and file moves."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+import io
 import json
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.exceptions import ClientError
 except ImportError:  # pragma: no cover - optional for tests
     boto3 = None
+
+    class ClientError(Exception):
+        """Stand-in so ``except ClientError`` still works without botocore."""
 import structlog
 
 logger = structlog.get_logger()
 
+# Results above PART_SIZE are uploaded as parallel multipart parts
+PART_SIZE = 8 * 1024 * 1024
+PART_CONCURRENCY = 10
+# Largest source CopyObject accepts; bigger objects need a multipart copy
+MAX_COPY_OBJECT_SIZE = 5 * 1024 * 1024 * 1024
+# DeleteObjects accepts at most this many keys per request
+DELETE_BATCH_SIZE = 1000
+
 
 class S3Loader:
     """Upload results and move files across S3 prefixes."""
@@ -31,32 +46,37 @@ class S3Loader:
         if s3_client is None and boto3 is None:
             raise ImportError("boto3 is required for S3 loading")
         self.s3 = s3_client or boto3.client("s3")
+        self.transfer_config = TransferConfig(
+            multipart_threshold=PART_SIZE,
+            multipart_chunksize=PART_SIZE,
+            max_concurrency=PART_CONCURRENCY,
+        ) if boto3 is not None else None
 
     def upload_results(self, results: List[dict], output_format: str) -> str:
         """Upload results to S3 as parquet or jsonl.
 
+        The output is serialized in memory and streamed to S3 (in parallel
+        multipart parts when large), without a temporary file.
+
         Returns the S3 key of the uploaded object.
         """
         run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         output_format = output_format.lower()
-        output_dir = Path("/tmp") / "pdf-results"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
 
         if output_format == "parquet":
-            output_path = output_dir / f"results_{run_id}.parquet"
+            filename = f"results_{run_id}.parquet"
             import pandas as pd
             df = pd.json_normalize(results)
-            df.to_parquet(output_path, index=False)
+            df.to_parquet(buffer, index=False)
         else:
-            output_path = output_dir / f"results_{run_id}.jsonl"
-            with open(output_path, "w", encoding="utf-8") as f:
-                for row in results:
-                    f.write(json.dumps(row))
-                    f.write("\n")
+            filename = f"results_{run_id}.jsonl"
+            buffer.write("".join(json.dumps(row) + "\n" for row in results).encode("utf-8"))
+        buffer.seek(0)
 
-        s3_key = f"{self.processed_prefix.rstrip('/')}/results/{output_path.name}"
+        s3_key = f"{self.processed_prefix.rstrip('/')}/results/{filename}"
         logger.info("Uploading results", key=s3_key)
-        self.s3.upload_file(str(output_path), self.bucket, s3_key)
+        self.s3.upload_fileobj(buffer, self.bucket, s3_key, Config=self.transfer_config)
         return s3_key
 
     def move_source(self, key: str, success: bool) -> str:
@@ -64,14 +84,52 @@ class S3Loader:
 
         Returns the new key.
         """
+        new_key = self._copy_to_prefix(key, success)
+        self.s3.delete_object(Bucket=self.bucket, Key=key)
+        return new_key
+
+    def move_sources(self, moves: Iterable[Tuple[str, bool]], max_workers: int = 32) -> List[str]:
+        """Move many raw files (key, success) to their processed or error prefix.
+
+        Copies run concurrently; the sources are then removed with one
+        DeleteObjects request per DELETE_BATCH_SIZE keys. If a copy fails,
+        nothing is deleted.
+
+        Returns the new keys, in input order.
+        """
+        moves = list(moves)
+        if not moves:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(moves)))) as executor:
+            new_keys = list(executor.map(lambda move: self._copy_to_prefix(*move), moves))
+
+        keys = [key for key, _ in moves]
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            response = self.s3.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in keys[start:start + DELETE_BATCH_SIZE]], "Quiet": True},
+            )
+            for error in response.get("Errors", []):
+                logger.error("Failed to delete S3 object", key=error.get("Key"), error=error.get("Message"))
+        return new_keys
+
+    def _copy_to_prefix(self, key: str, success: bool) -> str:
+        """Copy a raw file to the processed or error prefix; returns the new key."""
         filename = Path(key).name
         target_prefix = self.processed_prefix if success else self.error_prefix
         new_key = f"{target_prefix.rstrip('/')}/{filename}"
         logger.info("Moving S3 object", source=key, destination=new_key)
-        self.s3.copy_object(
-            Bucket=self.bucket,
-            CopySource={"Bucket": self.bucket, "Key": key},
-            Key=new_key,
-        )
-        self.s3.delete_object(Bucket=self.bucket, Key=key)
+        copy_source = {"Bucket": self.bucket, "Key": key}
+        try:
+            self.s3.copy_object(Bucket=self.bucket, CopySource=copy_source, Key=new_key)
+        except ClientError as e:
+            # InvalidRequest is also S3's code for the 5 GB CopyObject limit;
+            # only fall back when the source is actually that large
+            if (
+                e.response.get("Error", {}).get("Code") != "InvalidRequest"
+                or self.s3.head_object(Bucket=self.bucket, Key=key)["ContentLength"] <= MAX_COPY_OBJECT_SIZE
+            ):
+                raise
+            logger.info("Falling back to multipart copy", source=key)
+            self.s3.copy(copy_source, self.bucket, new_key, Config=self.transfer_config)
         return new_key
@@ -1,5 +1,4 @@
 """Database models using SQLAlchemy ORM."""
-from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
@@ -8,17 +7,25 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     create_engine,
+    func,
 )
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
 
 Base = declarative_base()
 
 
+def utc_now():
+    """SQL for the current transaction time as naive UTC (TIMESTAMP columns)."""
+    return func.timezone("utc", func.now())
+
+
 class Contract(Base):
     """Main contract entity."""
     
@@ -48,9 +55,9 @@ class Contract(Base):
     source_file_hash = Column(String(64))
     source_file_mtime = Column(DateTime)
     extraction_run_id = Column(String(64))
-    extraction_date = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    extraction_date = Column(DateTime, server_default=utc_now())
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now())
     
     # Relationships
     bidders = relationship("Bidder", back_populates="contract", cascade="all, delete-orphan")
@@ -61,6 +68,8 @@ class Bidder(Base):
     """Bidder information for each contract."""
     
     __tablename__ = "bidders"
+    # Same names as the migrations, so create_all() and alembic agree
+    __table_args__ = (Index("idx_bidders_contract", "contract_id"),)
     
     id = Column(Integer, primary_key=True)
     contract_id = Column(Integer, ForeignKey("contracts.id", ondelete="CASCADE"))
@@ -70,7 +79,7 @@ class Bidder(Base):
     bid_rank = Column(Integer)
     percentage_diff = Column(Numeric(6, 2))
     is_winner = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
     
     # Relationships
     contract = relationship("Contract", back_populates="bidders")
@@ -80,6 +89,7 @@ class BidItem(Base):
     """Line items from bid tabs."""
     
     __tablename__ = "bid_items"
+    __table_args__ = (Index("idx_bid_items_contract", "contract_id"),)
     
     id = Column(Integer, primary_key=True)
     contract_id = Column(Integer, ForeignKey("contracts.id", ondelete="CASCADE"))
@@ -91,7 +101,7 @@ class BidItem(Base):
     unit_price = Column(Numeric(12, 2))
     total_price = Column(Numeric(15, 2))
     bidder_name = Column(String(255))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
     
     # Relationships
     contract = relationship("Contract", back_populates="bid_items")
@@ -120,12 +130,35 @@ class ExtractionLog(Base):
     file_size_bytes = Column(Integer)
     file_mtime = Column(DateTime)
     run_id = Column(String(64))
-    extraction_timestamp = Column(DateTime, default=datetime.utcnow)
+    extraction_timestamp = Column(DateTime, server_default=utc_now())
+
+    # Latest extraction of a file
+    __table_args__ = (
+        Index("idx_extraction_logs_file_ts", file_path, extraction_timestamp.desc()),
+    )
 
 
 def get_engine(database_url: str):
-    """Create database engine."""
-    return create_engine(database_url, echo=False)
+    """Create database engine.
+
+    With psycopg2, multi-row INSERTs are sent as pages of 1000 VALUES rows
+    and other executemany statements (UPDATE/DELETE) through psycopg2's
+    execute_batch instead of one round-trip per row.
+
+    Pooled connections are checked before use and replaced after 30
+    minutes, so long runs do not fail on connections the server or a
+    proxy has dropped. The most recently used one is handed out first,
+    letting idle extras time out server-side.
+    """
+    options = {}
+    if make_url(database_url).get_driver_name() == "psycopg2":
+        options.update(
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500,
+            pool_use_lifo=True,
+        )
+    return create_engine(database_url, echo=False, pool_pre_ping=True, pool_recycle=1800, **options)
 
 
 def get_session(engine):
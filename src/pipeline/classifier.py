@@ -1,10 +1,11 @@
 """Document classifier to identify PDF types."""
 import re
 from enum import Enum
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
-import pypdf
+import fitz
 
 
 class DocumentType(Enum):
@@ -18,6 +19,18 @@ class DocumentType(Enum):
     UNKNOWN = "unknown"
 
 
+@cache
+def _extractor_map() -> dict:
+    """DocumentType -> extractor class, built on first use.
+
+    The extractors stay a lazy import, so importing the classifier does
+    not load every extractor module.
+    """
+    from src.extractors import EXTRACTORS
+
+    return {doc_type: EXTRACTORS.get(doc_type.value) for doc_type in DocumentType}
+
+
 class DocumentClassifier:
     """Classify PDF documents by type."""
     
@@ -29,6 +42,7 @@ class DocumentClassifier:
         """
         self.pdf_path = Path(pdf_path)
         self.filename = self.pdf_path.name.lower()
+        self._first_page_text: Optional[str] = None
     
     def classify(self) -> DocumentType:
         """Classify the document type.
@@ -79,13 +93,10 @@ class DocumentClassifier:
     def _classify_by_content(self) -> DocumentType:
         """Classify based on PDF content."""
         try:
-            # Extract first page text
-            reader = pypdf.PdfReader(str(self.pdf_path))
-            if len(reader.pages) == 0:
+            text = self._read_first_page_text()
+            if text is None:
                 return DocumentType.UNKNOWN
             
-            text = reader.pages[0].extract_text().lower()
-            
             # Check for distinctive patterns
             if "notice to prospective bidders" in text or "invitation to bid" in text:
                 return DocumentType.INVITATION_TO_BID
@@ -107,6 +118,19 @@ class DocumentClassifier:
         
         return DocumentType.UNKNOWN
     
+    def _read_first_page_text(self) -> Optional[str]:
+        """Lowercased text of the first page (None if the PDF has no pages).
+
+        Only page 0 is loaded, with PyMuPDF's C extractor; the result is
+        kept so repeated content checks do not reopen the file.
+        """
+        if self._first_page_text is None:
+            with fitz.open(self.pdf_path) as doc:
+                if doc.page_count == 0:
+                    return None
+                self._first_page_text = (doc.load_page(0).get_text() or "").lower()
+        return self._first_page_text
+    
     @staticmethod
     def get_extractor_class(doc_type: DocumentType):
         """Get the appropriate extractor class for document type.
@@ -117,22 +141,4 @@ class DocumentClassifier:
         Returns:
             Extractor class or None
         """
-        from src.extractors import (
-            AwardLetterExtractor,
-            BidSummaryExtractor,
-            BidTabsExtractor,
-            BidsAsReadExtractor,
-            InvitationToBidExtractor,
-            ItemCExtractor,
-        )
-        
-        mapping = {
-            DocumentType.INVITATION_TO_BID: InvitationToBidExtractor,
-            DocumentType.BID_TABS: BidTabsExtractor,
-            DocumentType.AWARD_LETTER: AwardLetterExtractor,
-            DocumentType.ITEM_C_REPORT: ItemCExtractor,
-            DocumentType.BID_SUMMARY: BidSummaryExtractor,
-            DocumentType.BIDS_AS_READ: BidsAsReadExtractor,
-        }
-        
-        return mapping.get(doc_type)
+        return _extractor_map()[doc_type]
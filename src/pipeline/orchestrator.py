@@ -1,10 +1,18 @@
 """Main pipeline orchestrator."""
 import hashlib
 import json
+import logging
+import mmap
+import os
+import re
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 from uuid import uuid4
 
 import structlog
@@ -15,19 +23,58 @@ from src.transformers.ocr import OCRProcessor
 
 logger = structlog.get_logger()
 
+# Upper bound on worker processes regardless of core count.
+MAX_WORKERS_CAP = 32
+
+_FILENAME_CONTRACT_PATTERNS = (
+    re.compile(r"(DA\d{5})", re.IGNORECASE),
+    re.compile(r"\b(\d{8})\b", re.IGNORECASE),
+)
+
+_worker_pipeline: Optional["Pipeline"] = None
+
+
+def _init_worker(pipeline: "Pipeline") -> None:
+    """Install the pipeline once per worker process instead of per task.
+
+    Workers log at WORKER_LOG_LEVEL (default WARNING): per-file INFO events
+    from every worker would otherwise contend on the shared stdout. Events
+    below the level are dropped by no-op methods before any rendering.
+    """
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+    level = logging.getLevelName(os.getenv("WORKER_LOG_LEVEL", "WARNING").strip().upper())
+    if isinstance(level, int):
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(level))
+
+
+def _process_one(task: tuple) -> Dict:
+    """Process a single PDF in a worker process (module-level so it pickles)."""
+    pdf_path, fingerprint = task
+    return _worker_pipeline.process_file(pdf_path, fingerprint)
+
 
 class Pipeline:
     """Main ETL pipeline orchestrator."""
     
-    def __init__(self, source_dir: str | Path, incremental: bool = False, state_file: Optional[str] = None):
+    def __init__(
+        self,
+        source_dir: str | Path,
+        incremental: bool = False,
+        state_file: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ):
         """Initialize pipeline.
         
         Args:
             source_dir: Directory containing PDF files
             incremental: Skip unchanged files using cached fingerprints
             state_file: Optional path for incremental state cache
+            max_workers: Worker processes for process_directory (default: CPU count)
         """
         self.source_dir = Path(source_dir)
+        self.max_workers = max_workers
         self.results = []
         self.incremental = incremental
         self.state_file = Path(state_file) if state_file else self.source_dir / ".pipeline_state.json"
@@ -39,33 +86,56 @@ class Pipeline:
         if not self.source_dir.exists():
             raise ValueError(f"Source directory does not exist: {self.source_dir}")
     
-    def discover_pdfs(self, pattern: str = "**/*.pdf") -> List[Path]:
-        """Discover all PDF files in source directory.
-        
+    def iter_pdfs(self, pattern: str = "**/*.pdf") -> Iterator[Path]:
+        """Lazily yield PDF files in source directory as the tree is walked.
+
         Args:
             pattern: Glob pattern for finding PDFs
-            
-        Returns:
-            List of PDF file paths
+
+        Yields:
+            PDF file paths
         """
-        pdf_files = list(self.source_dir.glob(pattern))
-        logger.info(f"Discovered {len(pdf_files)} PDF files")
-        return pdf_files
+        yield from self.source_dir.glob(pattern)
 
     def _compute_file_fingerprint(self, pdf_path: Path) -> Dict:
         """Compute a fingerprint for a file (hash, size, mtime)."""
         hasher = hashlib.sha256()
         with open(pdf_path, "rb") as f:
-            for chunk in iter(lambda: f.read(1024 * 1024), b""):
-                hasher.update(chunk)
+            stat = os.fstat(f.fileno())
+            # Hash straight from the page cache: no read() copies into Python buffers.
+            # Empty files cannot be mapped (and hash to the empty digest).
+            if stat.st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hasher.update(mapped)
 
-        stat = pdf_path.stat()
         return {
             "file_hash": hasher.hexdigest(),
             "file_size_bytes": stat.st_size,
             "file_mtime": stat.st_mtime,
+            "file_mtime_ns": stat.st_mtime_ns,
+            "file_inode": stat.st_ino,
         }
 
+    def _stat_unchanged_fingerprint(self, pdf_path: Path) -> Optional[Dict]:
+        """Return the cached fingerprint if (inode, mtime_ns, size) still match.
+
+        Lets unchanged files be skipped from a single stat() call, without
+        re-reading and hashing them. State written before these keys existed
+        falls back to the hash comparison.
+        """
+        cached = self._state.get(str(pdf_path))
+        if not cached or cached.get("file_mtime_ns") is None:
+            return None
+
+        stat = pdf_path.stat()
+        if (
+            cached.get("file_inode") == stat.st_ino
+            and cached.get("file_mtime_ns") == stat.st_mtime_ns
+            and cached.get("file_size_bytes") == stat.st_size
+        ):
+            return cached
+        return None
+
     def _load_state(self) -> Dict[str, Dict]:
         """Load incremental processing state from disk."""
         if not self.state_file.exists():
@@ -164,6 +234,7 @@ class Pipeline:
                 doc_type=doc_type,
                 file_name_for_mapping=pdf_path.name,
                 result_file_path=pdf_path,
+                file_hash=fingerprint.get("file_hash"),
             )
 
             self._normalize_contract_number(result, pdf_path)
@@ -311,15 +382,8 @@ class Pipeline:
 
     def _infer_contract_number_from_filename(self, filename: str) -> Optional[str]:
         """Infer contract number from filename."""
-        import re
-
-        patterns = [
-            r"(DA\d{5})",
-            r"\b(\d{8})\b",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
+        for pattern in _FILENAME_CONTRACT_PATTERNS:
+            match = pattern.search(filename)
             if match:
                 return match.group(1).upper()
         return None
@@ -331,10 +395,11 @@ class Pipeline:
         doc_type: DocumentType,
         file_name_for_mapping: str,
         result_file_path: Path,
+        file_hash: Optional[str] = None,
     ) -> Dict:
         """Run extraction and apply mapping for a PDF path."""
         extractor = extractor_class(pdf_path)
-        result = extractor.run_extraction()
+        result = extractor.run_extraction(file_hash=file_hash)
 
         if result.get("status") == "success" and result.get("data"):
             mapping = self.mapping_resolver.resolve(doc_type.value, file_name_for_mapping)
@@ -388,23 +453,47 @@ class Pipeline:
         Returns:
             List of extraction results
         """
-        pdf_files = self.discover_pdfs(pattern)
-
         if self.incremental:
             self._state = self._load_state()
         
-        results = []
-        for pdf_path in pdf_files:
-            fingerprint = self._compute_file_fingerprint(pdf_path)
+        # Unchanged files are resolved during the walk; the rest are handed to
+        # the workers as they are found, with their slot index so results keep
+        # discovery order.
+        results: List[Optional[Dict]] = []
+        pending = deque()
+
+        def _tasks() -> Iterator[tuple]:
+            discovered = skipped = 0
+            for pdf_path in self.iter_pdfs(pattern):
+                discovered += 1
+                # Non-incremental runs hash inside process_file, i.e. in the workers
+                fingerprint = None
+                unchanged = False
+                if self.incremental:
+                    fingerprint = self._stat_unchanged_fingerprint(pdf_path)
+                    unchanged = fingerprint is not None
+                    if not unchanged:
+                        fingerprint = self._compute_file_fingerprint(pdf_path)
+                        unchanged = self._is_unchanged(pdf_path, fingerprint)
+
+                if unchanged:
+                    skip_result = self._build_skip_result(pdf_path, fingerprint)
+                    skip_result.setdefault("metadata", {})["run_id"] = self.run_id
+                    results.append(skip_result)
+                    skipped += 1
+                    continue
+
+                pending.append((len(results), pdf_path, fingerprint))
+                results.append(None)
+                yield pdf_path, fingerprint
 
-            if self.incremental and self._is_unchanged(pdf_path, fingerprint):
-                skip_result = self._build_skip_result(pdf_path, fingerprint)
-                skip_result.setdefault("metadata", {})["run_id"] = self.run_id
-                results.append(skip_result)
-                continue
+            # Files are extracted while the walk runs, so the count is known only now
+            logger.info("Discovered PDF files", count=discovered, unchanged=skipped)
 
-            result = self.process_file(pdf_path, fingerprint)
-            results.append(result)
+        # Results come back in task order, so each one belongs to the oldest pending slot
+        for result in self._process_files(_tasks()):
+            index, pdf_path, fingerprint = pending.popleft()
+            results[index] = result
 
             if self.incremental and result.get("status") == "success":
                 self._state[str(pdf_path)] = fingerprint
@@ -427,6 +516,95 @@ class Pipeline:
         
         return results
     
+    def _get_max_workers(self, file_count: int) -> int:
+        """Pick the worker count: min(configured or CPU count, files, cap)."""
+        workers = self.max_workers or os.cpu_count() or 1
+        return max(1, min(workers, file_count, MAX_WORKERS_CAP))
+
+    def _process_files(self, tasks: Iterable[tuple]) -> Iterator[Dict]:
+        """Run process_file over (pdf_path, fingerprint) tasks, yielding results in order.
+
+        Extraction is CPU-bound and independent per file, so it is spread
+        over a process pool; a single worker runs in-process. Tasks are read
+        lazily, only a few per worker ahead of the results, so extraction
+        starts while the directory is still being walked.
+        """
+        tasks = iter(tasks)
+        # Read just enough tasks to size the pool
+        head = list(islice(tasks, self._get_max_workers(MAX_WORKERS_CAP)))
+        workers = self._get_max_workers(len(head))
+        if workers == 1:
+            for pdf_path, fingerprint in chain(head, tasks):
+                yield self.process_file(pdf_path, fingerprint)
+            return
+
+        logger.info("Processing files in parallel", workers=workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            # Bound in-flight work so the walk does not queue every file up front
+            in_flight = deque()
+            for task in chain(head, tasks):
+                in_flight.append(executor.submit(_process_one, task))
+                if len(in_flight) >= workers * 4:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    def serve(self, pdf_paths: Iterable[str | Path], on_result: Callable[[Dict], None]) -> int:
+        """Process a stream of PDF paths with one resident worker pool.
+
+        Workers import the extractors and compile their patterns once and are
+        reused for every path, so a long-running batch pays start-up cost a
+        single time. Results are handed to ``on_result`` as each file
+        completes (not necessarily in submission order); callbacks are
+        serialized.
+
+        Args:
+            pdf_paths: PDF paths, consumed lazily (e.g. lines read from stdin)
+            on_result: Called with each extraction result
+
+        Returns:
+            Number of files processed
+        """
+        workers = self._get_max_workers(MAX_WORKERS_CAP)
+        # Bound in-flight work so a fast producer cannot queue unbounded tasks
+        in_flight = threading.BoundedSemaphore(workers * 4)
+        deliver_lock = threading.Lock()
+
+        def _deliver(future: Future, pdf_path: Path) -> None:
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {
+                    "file_path": str(pdf_path),
+                    "document_type": "unknown",
+                    "status": "failed",
+                    "error": str(e),
+                }
+            try:
+                with deliver_lock:
+                    on_result(result)
+            finally:
+                in_flight.release()
+
+        count = 0
+        logger.info("Serving pipeline workers", workers=workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            for pdf_path in pdf_paths:
+                pdf_path = Path(pdf_path)
+                in_flight.acquire()
+                future = executor.submit(_process_one, (pdf_path, None))
+                future.add_done_callback(lambda done, path=pdf_path: _deliver(done, path))
+                count += 1
+        return count
+
     def get_summary(self) -> Dict:
         """Get pipeline execution summary.
         
@@ -437,21 +615,27 @@ class Pipeline:
             return {}
         
         total = len(self.results)
-        successful = sum(1 for r in self.results if r.get("status") == "success")
-        failed = sum(1 for r in self.results if r.get("status") == "failed")
-        skipped = sum(1 for r in self.results if r.get("status") == "skipped")
-        
-        # Group by document type
+        successful = 0
+        failed = 0
+        skipped = 0
+
+        # Single pass: status counts and per-document-type breakdown together
         by_type = {}
         for result in self.results:
+            status = result.get("status")
             doc_type = result.get("document_type", "unknown")
-            if doc_type not in by_type:
-                by_type[doc_type] = {"total": 0, "successful": 0, "failed": 0}
-            by_type[doc_type]["total"] += 1
-            if result.get("status") == "success":
-                by_type[doc_type]["successful"] += 1
-            elif result.get("status") == "failed":
-                by_type[doc_type]["failed"] += 1
+            type_stats = by_type.get(doc_type)
+            if type_stats is None:
+                type_stats = by_type[doc_type] = {"total": 0, "successful": 0, "failed": 0}
+            type_stats["total"] += 1
+            if status == "success":
+                successful += 1
+                type_stats["successful"] += 1
+            elif status == "failed":
+                failed += 1
+                type_stats["failed"] += 1
+            elif status == "skipped":
+                skipped += 1
         
         return {
             "total_files": total,
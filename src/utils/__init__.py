@@ -0,0 +1,5 @@
+"""Utilities shared by the pipeline scripts."""
+
+from .json_output import write_json
+
+__all__ = ["write_json"]
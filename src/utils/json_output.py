@@ -0,0 +1,77 @@
+"""JSON result file output shared by the pipeline scripts."""
+from __future__ import annotations
+
+import json
+import math
+from datetime import date, datetime, time
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional faster encoder
+    orjson = None
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Fallback for values neither encoder handles: numpy via tolist(), else str()."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def _key(key: Any) -> Any:
+    """Dict key as orjson's OPT_NON_STR_KEYS writes it."""
+    if isinstance(key, Enum):
+        key = key.value
+    if isinstance(key, (datetime, date, time)):
+        return key.isoformat()
+    return key
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert ``value`` so the stdlib encoder writes what orjson would.
+
+    orjson writes datetimes in ISO format, enums as their value, NaN and
+    infinity as null, and (with OPT_NON_STR_KEYS) date and enum dict keys as
+    strings; the stdlib encoder would call ``default`` (``str()``), write
+    ``NaN`` or raise instead.
+    """
+    if isinstance(value, dict):
+        return {_key(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (str, int)) or value is None:
+        return value
+    if isinstance(value, Enum):
+        return _jsonable(value.value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if hasattr(value, "tolist"):
+        return _jsonable(value.tolist())
+    return value
+
+
+def write_json(output_path: Path, data: Any) -> None:
+    """Write results as indented JSON, using orjson when it is installed.
+
+    Both encoders produce the same file: the stdlib path converts the data the
+    way orjson serializes it (see ``_jsonable``) and writes UTF-8 without
+    ASCII escapes. Floats are the same values, but very large or very small
+    ones may spell their exponent differently (``1e+16`` vs ``1e16``).
+
+    Args:
+        output_path: File to write
+        data: Results to serialize
+    """
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, default=_default, option=ORJSON_OPTIONS))
+        return
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(_jsonable(data), f, indent=2, default=_default, ensure_ascii=False)
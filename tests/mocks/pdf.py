@@ -12,7 +12,52 @@ class FakePage:
     def extract_text(self) -> str:
         return self.text
 
+    def get_text(self) -> str:
+        return self.text
+
 
-class FakePdfReader:
+class FakeFitzDocument:
     def __init__(self, pages: List[FakePage]):
         self.pages = pages
+
+    def __enter__(self) -> "FakeFitzDocument":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def __iter__(self):
+        return iter(self.pages)
+
+    def load_page(self, index: int) -> FakePage:
+        return self.pages[index]
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+
+class FakePlumberPage:
+    def __init__(self, tables: List[List[List[str]]]):
+        self.tables = tables
+        self.closed = False
+
+    def extract_text(self) -> str:
+        raise AssertionError("page text should come from the cached PyMuPDF pass")
+
+    def extract_tables(self) -> List[List[List[str]]]:
+        return self.tables
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakePlumberPdf:
+    def __init__(self, pages: List[FakePlumberPage]):
+        self.pages = pages
+
+    def __enter__(self) -> "FakePlumberPdf":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
@@ -4,7 +4,7 @@ from __future__ import annotations
 import pytest
 
 from pipeline.classifier import DocumentClassifier, DocumentType
-from tests.mocks.pdf import FakePage, FakePdfReader
+from tests.mocks.pdf import FakeFitzDocument, FakePage
 
 
 @pytest.mark.parametrize(
@@ -26,46 +26,60 @@ def test_classify_by_filename(filename, expected):
 
 def test_classify_by_content_invitation(monkeypatch):
     classifier = DocumentClassifier("unknown.pdf")
-    fake_reader = FakePdfReader([FakePage("Notice to Prospective Bidders")])
-    monkeypatch.setattr("pipeline.classifier.pypdf.PdfReader", lambda _: fake_reader)
+    fake_doc = FakeFitzDocument([FakePage("Notice to Prospective Bidders")])
+    monkeypatch.setattr("pipeline.classifier.fitz.open", lambda _: fake_doc)
     assert classifier.classify() == DocumentType.INVITATION_TO_BID
 
 
 def test_classify_by_content_award_letter(monkeypatch):
     classifier = DocumentClassifier("unknown.pdf")
-    fake_reader = FakePdfReader([FakePage("Notification of Award")])
-    monkeypatch.setattr("pipeline.classifier.pypdf.PdfReader", lambda _: fake_reader)
+    fake_doc = FakeFitzDocument([FakePage("Notification of Award")])
+    monkeypatch.setattr("pipeline.classifier.fitz.open", lambda _: fake_doc)
     assert classifier.classify() == DocumentType.AWARD_LETTER
 
 
 def test_classify_by_content_item_c(monkeypatch):
     classifier = DocumentClassifier("unknown.pdf")
-    fake_reader = FakePdfReader([FakePage("Item C $ Totals % Diff")])
-    monkeypatch.setattr("pipeline.classifier.pypdf.PdfReader", lambda _: fake_reader)
+    fake_doc = FakeFitzDocument([FakePage("Item C $ Totals % Diff")])
+    monkeypatch.setattr("pipeline.classifier.fitz.open", lambda _: fake_doc)
     assert classifier.classify() == DocumentType.ITEM_C_REPORT
 
 
 def test_classify_by_content_bid_tabs(monkeypatch):
     classifier = DocumentClassifier("unknown.pdf")
-    fake_reader = FakePdfReader([FakePage("Roadway Items Bidder")])
-    monkeypatch.setattr("pipeline.classifier.pypdf.PdfReader", lambda _: fake_reader)
+    fake_doc = FakeFitzDocument([FakePage("Roadway Items Bidder")])
+    monkeypatch.setattr("pipeline.classifier.fitz.open", lambda _: fake_doc)
     assert classifier.classify() == DocumentType.BID_TABS
 
 
 def test_classify_by_content_bids_as_read(monkeypatch):
     classifier = DocumentClassifier("unknown.pdf")
-    fake_reader = FakePdfReader([FakePage("Bids as read")])
-    monkeypatch.setattr("pipeline.classifier.pypdf.PdfReader", lambda _: fake_reader)
+    fake_doc = FakeFitzDocument([FakePage("Bids as read")])
+    monkeypatch.setattr("pipeline.classifier.fitz.open", lambda _: fake_doc)
     assert classifier.classify() == DocumentType.BIDS_AS_READ
 
 
 def test_classify_by_content_unknown_on_empty(monkeypatch):
     classifier = DocumentClassifier("unknown.pdf")
-    fake_reader = FakePdfReader([])
-    monkeypatch.setattr("pipeline.classifier.pypdf.PdfReader", lambda _: fake_reader)
+    fake_doc = FakeFitzDocument([])
+    monkeypatch.setattr("pipeline.classifier.fitz.open", lambda _: fake_doc)
     assert classifier.classify() == DocumentType.UNKNOWN
 
 
+def test_classify_by_content_reads_first_page_once(monkeypatch):
+    classifier = DocumentClassifier("unknown.pdf")
+    opened = []
+
+    def fake_open(path):
+        opened.append(path)
+        return FakeFitzDocument([FakePage("Bids as read"), FakePage("Invitation to Bid")])
+
+    monkeypatch.setattr("pipeline.classifier.fitz.open", fake_open)
+    assert classifier.classify() == DocumentType.BIDS_AS_READ
+    assert classifier.classify() == DocumentType.BIDS_AS_READ
+    assert len(opened) == 1
+
+
 def test_get_extractor_class_mapping():
     invite_cls = DocumentClassifier.get_extractor_class(DocumentType.INVITATION_TO_BID)
     bid_tabs_cls = DocumentClassifier.get_extractor_class(DocumentType.BID_TABS)
@@ -1,17 +1,37 @@
 """Tests for OCR alerting and new extractors."""
 from __future__ import annotations
 
+import importlib
+import importlib.util
 import json
+import re
+import time
+from datetime import date, datetime
 from pathlib import Path
 
+import fitz
 import pytest
-
-from extractors.base_extractor import BaseExtractor
+import structlog.testing
+
+from extractors import base_extractor
+from extractors.award_letter_extractor import AwardLetterExtractor
+from extractors.base_extractor import (
+    BaseExtractor,
+    compile_pattern,
+    parse_date,
+    parse_datetime,
+    parse_int,
+    parse_number,
+)
 from extractors.bid_summary_extractor import BidSummaryExtractor
+from extractors.bid_tabs_extractor import BidTabsExtractor
 from extractors.bids_as_read_extractor import BidsAsReadExtractor
+from extractors.invitation_extractor import InvitationToBidExtractor
+from extractors.item_c_extractor import ItemCExtractor
 from pipeline.classifier import DocumentType
 from pipeline.orchestrator import Pipeline
-from tests.mocks.pdf import FakePage, FakePdfReader
+from utils import json_output
+from tests.mocks.pdf import FakeFitzDocument, FakePage, FakePlumberPage, FakePlumberPdf
 
 
 class DummyExtractor(BaseExtractor):
@@ -25,8 +45,8 @@ def test_base_extractor_text_stats(monkeypatch, tmp_path):
     pdf_path = tmp_path / "sample.pdf"
     pdf_path.write_bytes(b"%PDF-1.4")
 
-    fake_reader = FakePdfReader([FakePage(""), FakePage("Some text")])
-    monkeypatch.setattr("extractors.base_extractor.pypdf.PdfReader", lambda _: fake_reader)
+    fake_doc = FakeFitzDocument([FakePage(""), FakePage("Some text")])
+    monkeypatch.setattr("extractors.base_extractor.fitz.open", lambda _: fake_doc)
 
     extractor = DummyExtractor(pdf_path)
     stats = extractor._extract_text_stats()
@@ -36,6 +56,267 @@ def test_base_extractor_text_stats(monkeypatch, tmp_path):
     assert stats["text_length"] == len("Some text")
 
 
+def test_base_extractor_parses_pdf_once(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    calls = []
+    fake_doc = FakeFitzDocument([FakePage("First"), FakePage("Second")])
+    monkeypatch.setattr(
+        "extractors.base_extractor.fitz.open",
+        lambda path: calls.append(path) or fake_doc,
+    )
+
+    extractor = DummyExtractor(pdf_path)
+    assert extractor.extract_text() == "First\nSecond\n"
+    assert extractor.extract_text_from_page(1) == "Second"
+    assert extractor._extract_text_stats()["text_page_count"] == 2
+    assert len(calls) == 1
+
+
+def test_run_extraction_reuses_cached_result(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    monkeypatch.setattr(
+        "extractors.base_extractor.fitz.open",
+        lambda path: FakeFitzDocument([FakePage("Contract DA00000")]),
+    )
+
+    calls = []
+    monkeypatch.setattr(DummyExtractor, "extract", lambda self: calls.append(1) or {"contract_number": "DA00000"})
+    cache_dir = tmp_path / "cache"
+
+    first = DummyExtractor(pdf_path, cache_dir=cache_dir).run_extraction()
+    second = DummyExtractor(pdf_path, cache_dir=cache_dir).run_extraction()
+
+    assert len(calls) == 1
+    assert second["data"] == first["data"]
+    assert second["metadata"]["cache_hit"] is True
+    assert second["metadata"]["text_length"] == first["metadata"]["text_length"]
+    assert len(list(cache_dir.glob("*.DummyExtractor.json"))) == 1
+
+
+def test_bidder_patterns_parse_rows_and_reject_long_runs():
+    bid_tabs = BidTabsExtractor.__new__(BidTabsExtractor)
+    item_c = ItemCExtractor.__new__(ItemCExtractor)
+
+    bidders = bid_tabs._extract_bidders_from_text("RILEY PAVING INC SUPPLY, NC\nCONTRACT TOTAL 1,387,101.46")
+    assert bidders[0]["bidder_name"] == "RILEY PAVING INC"
+    assert bidders[0]["total_bid_amount"] == 1387101.46
+
+    rows = item_c._extract_bidders("STEVENS TOWING CO INC  YONGES ISLAND, SC 2,220,630.54 -15.9")
+    assert rows[0]["total_bid_amount"] == 2220630.54 and rows[0]["percentage_diff"] == -15.9
+
+    # Long uppercase runs with no location/amount used to backtrack super-linearly
+    assert bid_tabs._extract_bidders_from_text("ACME INC\n" * 500) == []
+    assert item_c._extract_bidders("ACME INC\n" * 500) == []
+
+    # Same rows as the original patterns where a one-letter name or a
+    # comma-led amount makes the name/location split ambiguous
+    assert item_c._extract_bidders("A   ,1,234.56  -1") == []
+    rows = item_c._extract_bidders(",LLC LLC  ,1,234.56\n-1")
+    assert [(row["bidder_name"], row["bidder_location"]) for row in rows] == [("LLC", "LLC")]
+
+
+@pytest.mark.parametrize("text", ["ACME INC\n" * 20000, "AB ,   " * 20000, "AB" + " " * 100000 + "X"])
+def test_bidder_patterns_scan_adversarial_text_in_linear_time(text):
+    bid_tabs = BidTabsExtractor.__new__(BidTabsExtractor)
+    item_c = ItemCExtractor.__new__(ItemCExtractor)
+
+    # A quadratic scan takes minutes on these; a linear one a few milliseconds
+    started = time.perf_counter()
+    assert bid_tabs._extract_bidders_from_text(text) == []
+    assert item_c._extract_bidders(text) == []
+    assert time.perf_counter() - started < 2
+
+
+def test_bid_tabs_pdfplumber_reuses_cached_text(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "bid_tabs.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    table = [
+        ["Item", "Description", "Quantity", "Unit", "Unit Price", "Total"],
+        ["0010", "ASPHALT", "12", "TON", "10.00", "120.00"],
+    ]
+    plumber_page = FakePlumberPage([table])
+    monkeypatch.setattr(
+        "extractors.base_extractor.fitz.open",
+        lambda path: FakeFitzDocument([FakePage("Contract DA00123")]),
+    )
+    monkeypatch.setattr(
+        "extractors.bid_tabs_extractor.pdfplumber.open",
+        lambda path: FakePlumberPdf([plumber_page]),
+    )
+
+    data = BidTabsExtractor(pdf_path)._extract_with_pdfplumber()
+
+    assert data["contract_number"] == "DA00123"
+    assert data["bid_items"][0]["total_price"] == 120.0
+    assert plumber_page.closed
+
+
+def test_bid_tabs_skips_regex_pass_after_table_pass(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "bid_tabs.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    monkeypatch.setattr(
+        "extractors.base_extractor.fitz.open",
+        lambda path: FakeFitzDocument([FakePage("Contract DA00123")]),
+    )
+    monkeypatch.setattr(
+        "extractors.bid_tabs_extractor.pdfplumber.open",
+        lambda path: FakePlumberPdf([FakePlumberPage([])]),
+    )
+    extractor = BidTabsExtractor(pdf_path)
+    monkeypatch.setattr(extractor, "_extract_with_regex", lambda: pytest.fail("text re-parsed"))
+
+    data = extractor.extract()
+
+    assert data == {"contract_number": "DA00123", "bidders": [], "bid_items": []}
+
+
+def test_bid_tabs_table_rows_tolerate_short_and_empty_cells(tmp_path):
+    pdf_path = tmp_path / "bid_tabs.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    table = [
+        ["Item", "Description", "Quantity"],
+        ["0010", "ASPHALT", "1,200"],
+        [None, None, None],
+        ["0020"],
+        ["0030", None, "n/a", None, "", "5"],
+    ]
+
+    items = BidTabsExtractor(pdf_path)._parse_bid_items_table(table)
+
+    assert [item["item_number"] for item in items] == ["0010", "0020", "0030"]
+    assert items[0]["quantity"] == 1200.0
+    assert items[1]["description"] is None and items[1]["total_price"] is None
+    assert items[2]["quantity"] is None and items[2]["unit_price"] is None
+    assert items[2]["total_price"] == 5.0
+
+
+@pytest.mark.parametrize("use_re2", [True, False])
+def test_compile_pattern_honours_flags(monkeypatch, use_re2):
+    if not use_re2:
+        monkeypatch.setattr(base_extractor, "re2", None)
+    elif base_extractor.re2 is None:
+        pytest.skip("google-re2 not installed")
+
+    pattern = compile_pattern(r"award.*?(DA\d{5})", re.IGNORECASE | re.DOTALL)
+    match = pattern.search("NOTIFICATION OF AWARD\nContract DA12345")
+
+    assert match is not None and match.group(1) == "DA12345"
+    assert isinstance(pattern, re.Pattern) is not use_re2
+
+
+FIELD_TEXTS = (
+    "NOTIFICATION OF AWARD\nMarch 5, 2024\n\nRILEY PAVING INC\nSupply, NC\n\n"
+    "contract no. da12345\nWe are pleased to inform you that Riley Paving Inc\nhas been awarded "
+    "the contract in the amount of $1,387,101.46\nwbs element: 12345.3.1\ncounty: Brunswick\n"
+    "Description: Resurfacing\nof US 17\n",
+    "Invitation to Bid\nthe following project in division one:\n DA00123 – Resurfacing of NC 12\n"
+    "and approaches in Dare and Hyde Counties\nWBS Element: 47123\nThe date of availability "
+    "for this contract is May 1, 2024\nthe completion date for this contract is November 30, 2025\n"
+    "MBE goal = 5.0%\nwbe goal = 3%\ncombined mbe/wbe goal = 8%\nbid opening will be at 2:00 PM May 15, 2024\n",
+    "item c report da54321\nDA99999 20240115\nproposal length 12.5 miles\nType of Work   Resurfacing\n"
+    "location NC 12\nEstimate 2,500,000.00\ndate available jan 15 2024\nFinal Completion DEC 31 2025\n",
+)
+
+
+def test_field_patterns_match_the_same_under_re2_and_re(monkeypatch):
+    if base_extractor.re2 is None:
+        pytest.skip("google-re2 not installed")
+    modules = [
+        importlib.import_module(f"extractors.{name}")
+        for name in (
+            "award_letter_extractor",
+            "bid_summary_extractor",
+            "bid_tabs_extractor",
+            "bids_as_read_extractor",
+            "invitation_extractor",
+            "item_c_extractor",
+        )
+    ]
+    # Fresh copies of the modules compile FIELD_PATTERNS with re instead
+    monkeypatch.setattr(base_extractor, "re2", None)
+    matched = 0
+
+    for module in modules:
+        spec = importlib.util.spec_from_file_location(f"{module.__name__}_re", module.__file__)
+        stdlib_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(stdlib_module)
+
+        for name, cls in vars(module).items():
+            if not (isinstance(cls, type) and issubclass(cls, BaseExtractor) and cls.__module__ == module.__name__):
+                continue
+            stdlib_cls = getattr(stdlib_module, name)
+            with_re2 = cls.__new__(cls)
+            with_re = stdlib_cls.__new__(stdlib_cls)
+
+            for field, patterns in cls.FIELD_PATTERNS.items():
+                # Every field pattern compiles under RE2, with no fallback to re
+                assert not any(isinstance(pattern, re.Pattern) for pattern in patterns), (name, field)
+                assert all(isinstance(pattern, re.Pattern) for pattern in stdlib_cls.FIELD_PATTERNS[field])
+                for text in FIELD_TEXTS:
+                    result = with_re2.match_field(text, field)
+                    assert result == with_re.match_field(text, field), (name, field, text)
+                    matched += result is not None
+
+    assert matched > 30
+
+
+def test_match_field_skips_patterns_without_literal():
+    extractor = AwardLetterExtractor.__new__(AwardLetterExtractor)
+
+    assert extractor.match_field("no award here", "awarded_amount") is None
+    assert extractor.match_field(
+        "in the amount of $1,500.25", "awarded_amount", lambda s: float(s.replace(",", ""))
+    ) == 1500.25
+    # A conversion error falls through to the next pattern
+    assert extractor.match_field(
+        "Award Letter Smarch 1, 2020\nMarch 2, 2021",
+        "award_date",
+        lambda s: datetime.strptime(s, "%B %d, %Y").date(),
+    ) == date(2021, 3, 2)
+
+
+def test_parse_date_and_datetime_without_strptime():
+    assert parse_date("March 3, 2021") == date(2021, 3, 3)
+    assert parse_date("MAR 03 2021") == parse_date("03/03/2021") == parse_date("2021-03-03")
+    assert parse_date("Feb 30 2021") is None and parse_date("Smarch 1 2021") is None
+
+    assert parse_datetime("March 2, 2021", "2:00 pm") == datetime(2021, 3, 2, 14, 0)
+    assert parse_datetime("March 2, 2021", "12:15 AM") == datetime(2021, 3, 2, 0, 15)
+    assert parse_datetime("March 2, 2021", "13:00 PM") is None
+
+
+def test_invitation_prefers_cover_pages_and_falls_back_to_full_text(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "invitation.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    pages = [
+        FakePage("Contract No. DA00564\nCounty: Wake"),
+        FakePage("WBS Element: 12345.3.1"),
+        FakePage("Work in Durham County\nCombined MBE/WBE Goal = 9.0%"),
+    ]
+    monkeypatch.setattr("extractors.base_extractor.fitz.open", lambda path: FakeFitzDocument(pages))
+
+    data = InvitationToBidExtractor(pdf_path).extract()
+
+    assert data["contract_number"] == "DA00564"
+    assert data["wbs_element"] == "12345.3.1"
+    assert data["counties"] == "Wake"
+    assert data["combined_goal"] == 9.0
+    assert data["mbe_goal"] is None
+
+
+def test_parse_number_and_int_return_none_for_invalid_values():
+    assert parse_number("1,234.50") == 1234.5 and parse_number(" 12 ") == 12.0
+    assert parse_number(None) is None and parse_number("") is None and parse_number("n/a") is None
+    assert parse_int("3") == 3
+    assert parse_int(None) is None and parse_int("") is None and parse_int("3rd") is None
+
+
 def test_pipeline_assess_needs_ocr_when_empty(tmp_path):
     pipeline = Pipeline(tmp_path)
     result = {
@@ -158,3 +439,157 @@ def test_pipeline_skip_result_includes_run_id(tmp_path):
     assert len(results) == 1
     assert results[0]["status"] == "skipped"
     assert results[0]["metadata"]["run_id"] == pipeline.run_id
+
+
+def test_pipeline_incremental_skips_without_rehashing(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    pipeline = Pipeline(tmp_path, incremental=True)
+    fingerprint = pipeline._compute_file_fingerprint(pdf_path)
+    pipeline.state_file.write_text(json.dumps({str(pdf_path): fingerprint}), encoding="utf-8")
+
+    def fail_hash(_path):
+        raise AssertionError("unchanged file should not be re-hashed")
+
+    monkeypatch.setattr(pipeline, "_compute_file_fingerprint", fail_hash)
+    results = pipeline.process_directory("**/*.pdf")
+
+    assert results[0]["status"] == "skipped"
+    assert results[0]["metadata"]["file_hash"] == fingerprint["file_hash"]
+
+
+def test_pipeline_summary_counts_by_status_and_type(tmp_path):
+    pipeline = Pipeline(tmp_path)
+    pipeline.results = [
+        {"document_type": "bid_tabs", "status": "success"},
+        {"document_type": "bid_tabs", "status": "failed"},
+        {"document_type": "award_letter", "status": "skipped"},
+        {"document_type": "award_letter", "status": "partial"},
+    ]
+
+    summary = pipeline.get_summary()
+
+    assert summary["total_files"] == 4
+    assert (summary["successful"], summary["failed"], summary["skipped"]) == (1, 1, 1)
+    assert summary["success_rate"] == "25.0%"
+    assert summary["by_document_type"]["bid_tabs"] == {"total": 2, "successful": 1, "failed": 1}
+    assert summary["by_document_type"]["award_letter"] == {"total": 2, "successful": 0, "failed": 0}
+
+
+def test_pipeline_process_directory_parallel_keeps_order(tmp_path):
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF-1.4")
+
+    pipeline = Pipeline(tmp_path, max_workers=2)
+    assert pipeline._get_max_workers(3) == 2
+    assert pipeline._get_max_workers(1) == 1
+
+    results = pipeline.process_directory("**/*.pdf")
+
+    expected = [str(p) for p in pipeline.iter_pdfs("**/*.pdf")]
+    assert [r["file_path"] for r in results] == expected
+
+
+def test_pipeline_process_directory_extracts_while_walking(monkeypatch, tmp_path):
+    pipeline = Pipeline(tmp_path, max_workers=1)
+    events = []
+
+    def iter_pdfs(pattern):
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            events.append(("found", name))
+            yield tmp_path / name
+
+    def process_file(pdf_path, fingerprint=None):
+        events.append(("extracted", pdf_path.name))
+        return {"file_path": str(pdf_path), "status": "success"}
+
+    monkeypatch.setattr(pipeline, "iter_pdfs", iter_pdfs)
+    monkeypatch.setattr(pipeline, "process_file", process_file)
+
+    with structlog.testing.capture_logs() as logs:
+        results = pipeline.process_directory()
+
+    assert [r["file_path"] for r in results] == [str(tmp_path / name) for name in ("a.pdf", "b.pdf", "c.pdf")]
+    # The walk is not drained before the first file is extracted
+    assert events.index(("extracted", "a.pdf")) < events.index(("found", "c.pdf"))
+    discovered = [log for log in logs if log["event"] == "Discovered PDF files"]
+    assert [(log["count"], log["unchanged"]) for log in discovered] == [(3, 0)]
+
+
+def test_base_extractor_parallel_pages_keep_order(tmp_path):
+    pdf_path = tmp_path / "large.pdf"
+    doc = fitz.open()
+    for page_num in range(40):
+        doc.new_page().insert_text((72, 72), f"Page {page_num}")
+    doc.save(pdf_path)
+    doc.close()
+
+    serial = DummyExtractor(pdf_path, page_workers=0)
+    parallel = DummyExtractor(pdf_path, page_workers=3)
+
+    assert parallel._pages_text == serial._pages_text
+    assert parallel.extract_text_from_page(39).strip() == "Page 39"
+    assert parallel.extract_text_with_pdfplumber() == serial.extract_text_with_pdfplumber()
+    assert serial.extract_text_with_pdfplumber().splitlines()[-1] == "Page 39"
+
+
+def test_worker_init_filters_logs_below_warning(monkeypatch, tmp_path):
+    import pipeline.orchestrator as orchestrator
+
+    configured = {}
+    monkeypatch.setattr(orchestrator.structlog, "configure", lambda **kwargs: configured.update(kwargs))
+    monkeypatch.setattr(orchestrator, "_worker_pipeline", None)
+    monkeypatch.delenv("WORKER_LOG_LEVEL", raising=False)
+
+    pipeline = Pipeline(tmp_path)
+    orchestrator._init_worker(pipeline)
+
+    assert orchestrator._worker_pipeline is pipeline
+    wrapper = configured["wrapper_class"]
+    assert wrapper.info is wrapper.debug
+    assert wrapper.warning is not wrapper.info
+
+
+def test_pipeline_serve_reports_every_path(tmp_path):
+    paths = []
+    for name in ("a.pdf", "b.pdf"):
+        pdf_path = tmp_path / name
+        pdf_path.write_bytes(b"%PDF-1.4")
+        paths.append(pdf_path)
+    paths.append(tmp_path / "missing.pdf")
+
+    pipeline = Pipeline(tmp_path, max_workers=2)
+    results = []
+    count = pipeline.serve(iter(paths), results.append)
+
+    assert count == 3
+    assert sorted(r["file_path"] for r in results) == sorted(str(p) for p in paths)
+    assert next(r for r in results if r["file_path"].endswith("missing.pdf"))["status"] == "failed"
+
+
+def test_write_json_output_is_the_same_with_and_without_orjson(monkeypatch, tmp_path):
+    pytest.importorskip("orjson")
+    np = pytest.importorskip("numpy")
+    data = {
+        "run_at": datetime(2024, 1, 2, 3, 4, 5, 678),
+        "bid_date": date(2024, 1, 2),
+        "document_type": DocumentType.BID_TABS,
+        "ratio": float("nan"),
+        "amounts": (1387101.46, np.float64(2.5), np.int64(3)),
+        "pages": np.arange(3),
+        "by_rank": {1: "RILEY PAVING INC", date(2024, 1, 2): "ÉLAN CO"},
+        "path": Path("bids/DA00123.pdf"),
+    }
+
+    fast_path = tmp_path / "orjson.json"
+    json_output.write_json(fast_path, data)
+    monkeypatch.setattr(json_output, "orjson", None)
+    stdlib_path = tmp_path / "stdlib.json"
+    json_output.write_json(stdlib_path, data)
+
+    assert stdlib_path.read_bytes() == fast_path.read_bytes()
+    written = json.loads(fast_path.read_text(encoding="utf-8"))
+    assert written["run_at"] == "2024-01-02T03:04:05.000678"
+    assert written["ratio"] is None
+    assert written["by_rank"] == {"1": "RILEY PAVING INC", "2024-01-02": "ÉLAN CO"}
@@ -1,10 +1,17 @@
 """Tests for S3 ingestion and loader utilities."""
 from __future__ import annotations
 
+import io
+import threading
+import time
+from contextlib import nullcontext
+from decimal import Decimal
 from pathlib import Path
 
+import pytest
+
 from extractors.base_extractor import BaseExtractor
-from ingestors.s3_ingestor import IngestedFile, S3Ingestor
+from ingestors.s3_ingestor import PART_SIZE, IngestedFile, S3Ingestor
 from loaders.s3_loader import S3Loader
 from loaders.postgres_loader import PostgresLoader
 from models.database_models import Bidder
@@ -29,12 +36,16 @@ class FakeS3Client:
     def get_paginator(self, _name):
         return FakePaginator(self.pages)
 
-    def download_file(self, bucket, key, filename):
+    def download_file(self, bucket, key, filename, Config=None):
         self.downloaded.append((bucket, key, filename))
         Path(filename).write_bytes(b"%PDF-1.4")
 
-    def upload_file(self, filename, bucket, key):
-        self.uploads.append((filename, bucket, key))
+    def get_object(self, Bucket, Key):
+        self.downloaded.append((Bucket, Key, None))
+        return {"Body": io.BytesIO(b"%PDF-1.4")}
+
+    def upload_fileobj(self, fileobj, bucket, key, Config=None):
+        self.uploads.append((fileobj.read(), bucket, key))
 
     def copy_object(self, **kwargs):
         self.copies.append(kwargs)
@@ -42,6 +53,10 @@ class FakeS3Client:
     def delete_object(self, **kwargs):
         self.deletes.append(kwargs)
 
+    def delete_objects(self, **kwargs):
+        self.deletes.append(kwargs)
+        return {}
+
 
 class FakeQuery:
     def __init__(self, rows):
@@ -58,6 +73,8 @@ class FakeSession:
     def __init__(self, rows):
         self.rows = rows
         self.added = []
+        self.executed = []
+        self.commits = 0
 
     def query(self, _model):
         return FakeQuery(self.rows)
@@ -65,8 +82,14 @@ class FakeSession:
     def add(self, item):
         self.added.append(item)
 
+    def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+
     def commit(self):
-        return None
+        self.commits += 1
+
+    def begin_nested(self):
+        return nullcontext()
 
     def rollback(self):
         return None
@@ -96,6 +119,87 @@ def test_s3_ingestor_lists_and_downloads(tmp_path):
     assert files[0].local_path.exists()
 
 
+def test_s3_ingestor_downloads_concurrently_in_key_order(tmp_path):
+    keys = [f"raw/{index}.pdf" for index in range(8)]
+    client = FakeS3Client(pages=[{"Contents": [{"Key": key} for key in keys]}])
+    threads = set()
+    download_file = client.download_file
+
+    def tracking_download(bucket, key, filename, Config=None):
+        threads.add(threading.get_ident())
+        time.sleep(0.01)
+        download_file(bucket, key, filename, Config=Config)
+
+    client.download_file = tracking_download
+    ingestor = S3Ingestor(bucket="bucket", raw_prefix="raw/", local_dir=tmp_path, s3_client=client, max_workers=4)
+
+    files = ingestor.download_all()
+
+    assert [f.key for f in files] == keys
+    assert all(f.local_path.exists() for f in files)
+    assert len(threads) > 1
+
+
+def test_s3_ingestor_skips_unchanged_objects(tmp_path):
+    contents = [
+        {"Key": "raw/one.pdf", "ETag": '"a1"', "Size": 8},
+        {"Key": "raw/two.pdf", "ETag": '"b1"', "Size": 8},
+    ]
+    client = FakeS3Client(pages=[{"Contents": contents}])
+    ingestor = S3Ingestor(bucket="bucket", raw_prefix="raw/", local_dir=tmp_path, s3_client=client)
+
+    assert len(ingestor.download_all()) == 2
+    assert len(client.downloaded) == 2
+
+    contents[1]["ETag"] = '"b2"'
+    (tmp_path / "one.pdf").unlink()
+    files = ingestor.download_all()
+
+    assert [f.key for f in files] == ["raw/one.pdf", "raw/two.pdf"]
+    assert sorted(key for _, key, _ in client.downloaded[2:]) == ["raw/one.pdf", "raw/two.pdf"]
+
+    ingestor.download_all()
+    assert len(client.downloaded) == 4
+
+
+def test_s3_ingestor_resumes_after_interrupted_run(tmp_path):
+    contents = [{"Key": f"raw/{index}.pdf", "ETag": f'"{index}"', "Size": 8} for index in range(3)]
+    client = FakeS3Client(pages=[{"Contents": contents}])
+    get_object = client.get_object
+
+    def failing_get_object(Bucket, Key):
+        if Key == "raw/2.pdf":
+            raise ConnectionError("connection reset")
+        return get_object(Bucket=Bucket, Key=Key)
+
+    client.get_object = failing_get_object
+    ingestor = S3Ingestor(bucket="bucket", raw_prefix="raw/", local_dir=tmp_path, s3_client=client, max_workers=1)
+    with pytest.raises(ConnectionError):
+        ingestor.download_all()
+
+    client.get_object = get_object
+    ingestor.download_all()
+
+    assert [key for _, key, _ in client.downloaded] == ["raw/0.pdf", "raw/1.pdf", "raw/2.pdf"]
+
+
+def test_s3_ingestor_streams_small_objects_and_uses_transfer_for_large(tmp_path):
+    contents = [
+        {"Key": "raw/small.pdf", "ETag": '"s"', "Size": 8},
+        {"Key": "raw/large.pdf", "ETag": '"l"', "Size": PART_SIZE},
+    ]
+    client = FakeS3Client(pages=[{"Contents": contents}])
+    ingestor = S3Ingestor(bucket="bucket", raw_prefix="raw/", local_dir=tmp_path, s3_client=client, max_workers=1)
+
+    ingestor.download_all()
+
+    assert client.downloaded == [
+        ("bucket", "raw/small.pdf", None),
+        ("bucket", "raw/large.pdf", str(tmp_path / "large.pdf")),
+    ]
+    assert (tmp_path / "small.pdf").read_bytes() == b"%PDF-1.4"
+
+
 def test_s3_ingestor_build_key_map(tmp_path):
     files = [
         IngestedFile(key="raw/one.pdf", local_path=tmp_path / "one.pdf"),
@@ -120,7 +224,8 @@ def test_s3_loader_upload_and_move(tmp_path):
     key = loader.upload_results(results, output_format="jsonl")
 
     assert key.startswith("processed/results/")
-    assert len(client.uploads) == 1
+    assert key.endswith(".jsonl")
+    assert client.uploads == [(b'{"file_path": "a.pdf", "status": "success"}\n', "bucket", key)]
 
     moved_key = loader.move_source("raw/a.pdf", success=False)
     assert moved_key == "error/a.pdf"
@@ -128,6 +233,49 @@ def test_s3_loader_upload_and_move(tmp_path):
     assert len(client.deletes) == 1
 
 
+def test_s3_loader_move_sources_batches_deletes(monkeypatch):
+    monkeypatch.setattr("loaders.s3_loader.DELETE_BATCH_SIZE", 2)
+    client = FakeS3Client()
+    loader = S3Loader(bucket="bucket", processed_prefix="processed/", error_prefix="error/", s3_client=client)
+
+    moves = [("raw/a.pdf", True), ("raw/b.pdf", False), ("raw/c.pdf", True)]
+    new_keys = loader.move_sources(moves, max_workers=3)
+
+    assert new_keys == ["processed/a.pdf", "error/b.pdf", "processed/c.pdf"]
+    assert sorted(copy["Key"] for copy in client.copies) == sorted(new_keys)
+    assert [[obj["Key"] for obj in delete["Delete"]["Objects"]] for delete in client.deletes] == [
+        ["raw/a.pdf", "raw/b.pdf"],
+        ["raw/c.pdf"],
+    ]
+
+
+def test_s3_loader_falls_back_to_multipart_copy_for_large_objects():
+    from botocore.exceptions import ClientError
+
+    from loaders.s3_loader import MAX_COPY_OBJECT_SIZE
+
+    client = FakeS3Client()
+    managed = []
+    sizes = {"raw/huge.pdf": MAX_COPY_OBJECT_SIZE + 1, "raw/small.pdf": 8}
+
+    def invalid_request(**_kwargs):
+        raise ClientError({"Error": {"Code": "InvalidRequest"}}, "CopyObject")
+
+    client.copy_object = invalid_request
+    client.head_object = lambda Bucket, Key: {"ContentLength": sizes[Key]}
+    client.copy = lambda source, bucket, key, Config=None: managed.append((source["Key"], key))
+    loader = S3Loader(bucket="bucket", processed_prefix="processed/", error_prefix="error/", s3_client=client)
+
+    assert loader.move_source("raw/huge.pdf", success=True) == "processed/huge.pdf"
+    assert managed == [("raw/huge.pdf", "processed/huge.pdf")]
+    assert client.deletes == [{"Bucket": "bucket", "Key": "raw/huge.pdf"}]
+
+    with pytest.raises(ClientError):
+        loader.move_source("raw/small.pdf", success=True)
+    assert len(managed) == 1
+    assert len(client.deletes) == 1
+
+
 def test_postgres_loader_dedup_bidders():
     loader = PostgresLoader.__new__(PostgresLoader)
     existing = [Bidder(bidder_name="ACME", total_bid_amount=100.0)]
@@ -142,26 +290,95 @@ def test_postgres_loader_dedup_bidders():
     count = PostgresLoader.load_bidders(loader, contract_id=1, bidders=bidders)
 
     assert count == 1
-    assert len(loader.session.added) == 1
-    assert loader.session.added[0].total_bid_amount == 200.0
+    assert len(loader.session.executed) == 1
+    assert loader.session.executed[0][1] == [
+        {"bidder_name": "ACME", "total_bid_amount": 200.0, "contract_id": 1}
+    ]
+    assert loader.session.commits == 1
+
+
+def test_postgres_loader_dedups_stored_decimal_amounts():
+    loader = PostgresLoader.__new__(PostgresLoader)
+    loader.session = FakeSession([Bidder(bidder_name="ACME", total_bid_amount=Decimal("100.00"))])
+
+    count = PostgresLoader.load_bidders(loader, contract_id=1, bidders=[
+        {"bidder_name": " acme ", "total_bid_amount": 100.0},
+        {"bidder_name": "ACME", "total_bid_amount": 100.5},
+    ])
+
+    assert count == 1
+    assert loader.session.executed[0][1][0]["total_bid_amount"] == 100.5
+
+
+def test_postgres_loader_copies_rows_as_escaped_text():
+    copied = []
+
+    class FakeCursor:
+        def copy_expert(self, sql, buffer):
+            copied.append((sql, buffer.read()))
+
+        def close(self):
+            pass
+
+    class FakeConnection:
+        connection = type("FakeDBAPIConnection", (), {"cursor": lambda self: FakeCursor()})()
+
+    loader = PostgresLoader.__new__(PostgresLoader)
+    loader.session = FakeSession([])
+    loader.session.connection = FakeConnection
+    loader._copy_supported = True
+
+    count = PostgresLoader.load_bidders(loader, contract_id=7, bidders=[
+        {"bidder_name": "A\tB\\C", "total_bid_amount": 100.5, "is_winner": True},
+        {"bidder_name": "D", "total_bid_amount": None},
+    ])
+
+    assert count == 2
+    assert loader.session.executed == []
+    sql, data = copied[0]
+    assert sql.startswith("COPY bidders (contract_id, bidder_name, bidder_location, total_bid_amount,")
+    first, second = data.splitlines()
+    assert first.split("\t")[:7] == ["7", "A\\tB\\\\C", "\\N", "100.5", "\\N", "\\N", "t"]
+    assert second.split("\t")[:7] == ["7", "D", "\\N", "\\N", "\\N", "\\N", "f"]
+
+
+def test_postgres_loader_bid_items_in_one_insert():
+    loader = PostgresLoader.__new__(PostgresLoader)
+    loader.session = FakeSession([])
+
+    items = [
+        {"item_number": "0010", "quantity": 12.0},
+        {"item_number": "0020", "not_a_column": "x"},
+        {"item_number": "0030", "item_code": "A1"},
+    ]
+
+    count = PostgresLoader.load_bid_items(loader, contract_id=3, items=items)
+
+    assert count == 2
+    assert len(loader.session.executed) == 1
+    assert [row["item_number"] for row in loader.session.executed[0][1]] == ["0010", "0030"]
+    assert all(row["contract_id"] == 3 for row in loader.session.executed[0][1])
+    assert loader.session.commits == 1
 
 
 def test_postgres_loader_partial_loads_data():
     loader = PostgresLoader.__new__(PostgresLoader)
-    loader.log_extraction = lambda _result: None
+    loader.session = FakeSession([])
+    loader.log_extraction = lambda _result, commit=True: None
 
     captured = {}
 
     class DummyContract:
         id = 7
 
-    def fake_load_contract(data):
+    def fake_load_contract(data, commit=True):
         captured["contract_number"] = data.get("contract_number")
+        captured["commit"] = commit
         return DummyContract()
 
     loader.load_contract = fake_load_contract
-    loader.load_bidders = lambda _contract_id, _bidders: 1
-    loader.load_bid_items = lambda _contract_id, _items: 0
+    loader.load_bidders = lambda _contract_id, _bidders, commit=True: 1
+    loader.load_bid_items = lambda _contract_id, _items, commit=True: 0
 
     result = {
         "status": "partial",
@@ -171,3 +388,97 @@ def test_postgres_loader_partial_loads_data():
 
     assert PostgresLoader.load_extraction_result(loader, result) is True
     assert captured["contract_number"] == "DA123"
+    assert captured["commit"] is False
+    assert loader.session.commits == 1
+
+
+def test_postgres_loader_batch_logs_in_one_insert():
+    loader = PostgresLoader.__new__(PostgresLoader)
+    loader.session = FakeSession([])
+    loaded = []
+    loader.load_extraction_result = lambda result, log=True, **_kwargs: loaded.append(log) or True
+
+    results = [
+        {"file_path": "a.pdf", "status": "success", "metadata": {"run_id": "r1", "needs_ocr_reasons": ["x"]}},
+        # The shape BaseExtractor.run_extraction returns for a failed file
+        {"file_path": "b.pdf", "status": "failed", "data": None, "error": "boom", "metadata": {}},
+    ]
+
+    summary = PostgresLoader.load_batch(loader, results)
+
+    assert summary["successful"] == 2
+    assert loaded == [False, False]
+    assert len(loader.session.executed) == 1
+    assert loader.session.commits == 1
+    rows = loader.session.executed[0][1]
+    assert [row["file_path"] for row in rows] == ["a.pdf", "b.pdf"]
+    assert rows[0]["needs_ocr_reasons"] == "x"
+    assert rows[1]["error_message"] == "boom"
+
+
+def test_postgres_loader_logs_mixed_statuses_row_by_row_on_bulk_failure():
+    class CheckedSession(FakeSession):
+        def execute(self, statement, params=None):
+            # Mimics the extraction_logs status CHECK constraint
+            if any(row["status"] not in ("success", "partial", "failed", "skipped") for row in params):
+                raise ValueError("violates check constraint extraction_logs_status_check")
+            super().execute(statement, params)
+
+    loader = PostgresLoader.__new__(PostgresLoader)
+    loader.session = CheckedSession([])
+    results = [
+        {"file_path": "a.pdf", "status": "skipped", "error": "unchanged"},
+        {"file_path": "b.pdf", "status": "success"},
+        {"file_path": "c.pdf", "status": "bogus"},
+    ]
+
+    assert PostgresLoader.log_extractions(loader, results[:2]) == 2
+    assert [row["status"] for row in loader.session.executed[0][1]] == ["skipped", "success"]
+
+    assert PostgresLoader.log_extractions(loader, results) == 2
+    assert [params[0]["file_path"] for _, params in loader.session.executed[1:]] == ["a.pdf", "b.pdf"]
+    assert loader.session.commits == 2
+
+
+def test_postgres_loader_batch_commits_once_and_isolates_failures():
+    loader = PostgresLoader.__new__(PostgresLoader)
+    loader.session = FakeSession([])
+    loader._existing_bidder_keys = lambda _numbers: {}
+    written = []
+
+    def fake_write(result, _log, _existing_bidder_keys):
+        if result["file_path"] == "bad.pdf":
+            raise RuntimeError("boom")
+        written.append(result["file_path"])
+        return True
+
+    loader._write_extraction_result = fake_write
+    results = [
+        {"file_path": "a.pdf", "status": "failed"},
+        {"file_path": "bad.pdf", "status": "failed"},
+        {"file_path": "c.pdf", "status": "failed"},
+    ]
+
+    summary = PostgresLoader.load_batch(loader, results)
+
+    assert summary["successful"] == 2
+    assert written == ["a.pdf", "c.pdf"]
+    assert loader.session.commits == 1
+
+
+def test_postgres_loader_groups_results_by_contract():
+    loader = PostgresLoader.__new__(PostgresLoader)
+    results = [
+        {"file_path": "DA00001_tabs.pdf", "data": {}},
+        {"file_path": "b.pdf", "data": {"contract_number": "DA00002"}},
+        {"file_path": "c.pdf", "data": {"contract_number": " da00001 "}},
+        {"file_path": "d.pdf", "status": "failed", "data": None},
+    ]
+
+    groups = PostgresLoader._group_by_contract(loader, results)
+
+    assert [[r["file_path"] for r in group] for group in groups] == [
+        ["DA00001_tabs.pdf", "c.pdf"],
+        ["b.pdf"],
+        ["d.pdf"],
+    ]